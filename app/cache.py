@@ -0,0 +1,153 @@
+"""
+In-process result cache for hot read paths
+"""
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Tuple
+
+from app.config import get_settings
+from app.database import get_write_generation
+
+settings = get_settings()
+
+# Returned by ResultCache.get when there is no usable entry
+MISS = object()
+
+
+class ResultCache:
+    """
+    LRU cache with a TTL whose entries are tagged with the write generation.
+
+    An entry is only served while the database is still at the generation
+    it was read at, so any committed write invalidates every cached result
+    at once without tracking which rows a result depends on. The TTL bounds
+    how long an unused entry keeps its memory.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # Dropped to make room (LRU)
+        self.expirations = 0  # Dropped because the TTL ran out
+        self.invalidations = 0  # Dropped because a write happened since
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, generation: int) -> Any:
+        """
+        Return the cached value for the key, or MISS
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return MISS
+
+        entry_generation, expires_at, value = entry
+        if entry_generation != generation:
+            del self._entries[key]
+            self.invalidations += 1
+            self.misses += 1
+            return MISS
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return MISS
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, generation: int, value: Any):
+        """
+        Store a value read at the given write generation
+        """
+        if generation != get_write_generation():
+            # A write committed while this was being read; it may be stale
+            return
+
+        self._entries[key] = (generation, time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "write_generation": get_write_generation()
+        }
+
+
+result_cache = ResultCache(settings.result_cache_size, settings.result_cache_ttl_seconds)
+
+
+def cached(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Cache an async read function's results in the shared result cache
+
+    The key is the function plus its arguments with defaults applied, so
+    `f(x)` and `f(x, limit=20)` share an entry. Calls with unhashable
+    arguments skip the cache. Cached results are shared between callers
+    and must not be mutated.
+
+    Usage:
+        @staticmethod
+        @cached
+        async def get_decision_by_id(decision_id: int) -> Optional[Decision]:
+            ...
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not result_cache.enabled:
+            return await func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__qualname__,) + tuple(bound.arguments.items())
+        try:
+            hash(key)
+        except TypeError:
+            return await func(*args, **kwargs)
+
+        generation = get_write_generation()
+        value = result_cache.get(key, generation)
+        if value is not MISS:
+            return value
+
+        value = await func(*args, **kwargs)
+        result_cache.put(key, generation, value)
+        return value
+
+    return wrapper
+
+
+def get_cache_status() -> dict:
+    """
+    Describe the result cache for the health endpoint
+    """
+    return result_cache.stats()
@@ -3,6 +3,7 @@ Configuration management for DecisionNote Agent
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -10,7 +11,48 @@ class Settings(BaseSettings):
     Application settings loaded from environment variables
     """
     # API Keys
-    gemini_api_key: str
+    gemini_api_key: str = ""  # Required unless LLM_PROVIDER=stub
+    
+    # LLM Provider
+    llm_provider: Literal["gemini", "stub"] = "gemini"  # "stub" answers offline, for load tests
+    llm_stub_latency_distribution: Literal["fixed", "uniform", "lognormal"] = "lognormal"
+    llm_stub_latency_ms: float = 400.0  # Median simulated latency
+    llm_stub_latency_spread: float = 0.5  # Lognormal sigma, or ± fraction for uniform
+    llm_stub_model_latency_ms: Dict[str, float] = {}  # Per-model medians, e.g. {"gemini-2.5-pro": 2000}
+    llm_stub_failure_rate: float = 0.0  # Share of stub requests that raise an error
+    llm_stub_hang_rate: float = 0.0  # Share of stub requests that never answer
+    llm_stub_seed: int = 0
+    
+    # LLM Calls
+    llm_max_concurrency: int = 4  # Gemini requests in flight at once; others wait their turn
+    llm_validation_timeout_seconds: float = 15.0  # Includes waiting for a slot; falls back to local checks
+    llm_summary_timeout_seconds: float = 60.0
+    llm_command_deadline_seconds: float = 20.0  # Total LLM time one chat command may spend
+    llm_breaker_window: int = 20  # Recent calls the circuit breaker looks at
+    llm_breaker_min_calls: int = 5  # Calls needed in the window before the breaker can trip
+    llm_breaker_failure_rate: float = 0.5  # Share of failed or slow calls that trips the breaker
+    llm_breaker_slow_call_seconds: float = 10.0  # Successful calls at least this slow count as failures
+    llm_breaker_cooldown_seconds: float = 30.0  # How long an open breaker skips the LLM
+    llm_hedge_requests: bool = False  # Send a second request when the first passes the p95 latency
+    llm_hedge_min_samples: int = 20  # Latency samples needed before hedging starts
+    llm_latency_window: int = 200  # Recent latencies kept for p50/p95
+    llm_latency_max_age_seconds: float = 300.0  # Older latencies are ignored
+    
+    # Model Routing (fallback models take over when the primary is too slow for the time left)
+    validation_model: str = "gemini-2.5-flash"
+    validation_fallback_model: Optional[str] = "gemini-2.5-flash-lite"
+    validation_max_output_tokens: int = 512
+    validation_temperature: float = 0.0
+    summary_model: str = "gemini-2.5-pro"
+    summary_fallback_model: Optional[str] = "gemini-2.5-flash"
+    summary_max_output_tokens: int = 1024
+    summary_temperature: float = 0.7
+    validation_accept_score: float = 0.8  # Local score at or above which text is accepted without Gemini
+    validation_reject_score: float = 0.2  # Local score at or below which text is rejected without Gemini
+    validation_batch_window_ms: float = 25.0  # Concurrent validations arriving within this window share one request
+    validation_batch_max_size: int = 16  # 1 disables batching
+    validation_cache_size: int = 1024  # In-memory entries in front of the validation_cache table
+    validation_cache_ttl_hours: float = 168.0
     
     # Server Configuration
     host: str = "0.0.0.0"
@@ -21,13 +63,41 @@ class Settings(BaseSettings):
     voting_approval_threshold: int = 2
     voting_timeout_minutes: int = 60
     allow_self_approve: bool = False
+    expiry_sweep_tick_seconds: float = 5.0  # Proposals expiring within the same tick are expired together
+    proposal_expiry_webhook_url: Optional[str] = None  # Post a notice here when proposals expire
     
     # Daily Summary Configuration
     summary_time: str = "17:00"
-    summary_timezone: str = "Africa/Lagos"
+    summary_timezone: str = "Africa/Lagos"  # Also defines calendar days for "today" and date filters
+    summary_map_reduce_min_decisions: int = 40  # Above this many decisions, summarize in chunks first
+    summary_map_reduce_min_tokens: int = 6000  # ...or above this estimated prompt size
+    summary_chunk_max_decisions: int = 25
+    summary_map_concurrency: int = 4  # Chunk summaries generated at once
+    
+    # Search
+    fuzzy_search_min_results: int = 3  # Fall back to typo-tolerant search below this many hits
+    fuzzy_search_threshold: float = 0.4  # Minimum trigram similarity for a spelling correction
+    
+    # Similarity Search
+    similarity_top_k: int = 5
+    similarity_min_score: float = 0.2
+    duplicate_similarity_threshold: float = 0.7  # Estimated Jaccard similarity of character shingles
     
     # Database
     database_path: str = "data/decisionnote.db"
+    database_pool_size: int = 4  # Read connections; one extra writer is always opened
+    write_batch_max_size: int = 64  # Max writes group-committed in one transaction
+    write_batch_max_delay_ms: float = 2.0  # How long a commit window waits for more writes
+    database_pragma_profile: Literal["durable", "balanced", "throughput"] = "balanced"
+    database_busy_timeout_ms: int = 5000
+    wal_checkpoint_interval_seconds: float = 30.0  # 0 disables periodic checkpoints
+    wal_truncate_threshold_pages: int = 4000  # WAL size that escalates a periodic checkpoint to TRUNCATE
+    wal_autocheckpoint_pages: int = 10000  # SQLite's own checkpoint-on-commit, kept as a backstop; 0 disables it
+    history_keyframe_interval: int = 10  # Every Nth edit stores the full previous text; others store a diff
+    
+    # Result Cache
+    result_cache_size: int = 512  # Cached list/search/lookup results; 0 disables the cache
+    result_cache_ttl_seconds: float = 30.0
     
     class Config:
         env_file = ".env"
@@ -2,32 +2,461 @@
 Database connection and initialization
 """
 import aiosqlite
+import asyncio
 import os
+from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional
+from app.config import get_settings
 from app.schemas import (
     CREATE_DECISIONS_TABLE,
     CREATE_PROPOSED_DECISIONS_TABLE,
     CREATE_DECISION_HISTORY_TABLE,
+    CREATE_PROPOSAL_VOTES_TABLE,
+    CREATE_VALIDATION_CACHE_TABLE,
+    CREATE_PROPOSAL_VOTES_TALLY_INDEX,
     CREATE_DECISIONS_INDEX,
+    CREATE_DECISIONS_DAY_INDEX,
     CREATE_DECISIONS_USER_INDEX,
-    CREATE_PROPOSED_STATUS_INDEX
+    CREATE_DECISIONS_TOPIC_INDEX,
+    CREATE_DECISIONS_PROPOSAL_INDEX,
+    CREATE_PROPOSED_STATUS_INDEX,
+    CREATE_DECISION_HISTORY_INDEX,
+    DROP_LEGACY_DECISIONS_TIMESTAMP_INDEX,
+    DROP_LEGACY_DECISIONS_USER_INDEX,
+    CREATE_DECISIONS_FTS_TABLE,
+    CREATE_DECISIONS_FTS_INSERT_TRIGGER,
+    CREATE_DECISIONS_FTS_UPDATE_TRIGGER,
+    CREATE_DECISIONS_FTS_DELETE_TRIGGER,
+    REBUILD_DECISIONS_FTS,
+    ADD_DECISIONS_EMBEDDING_COLUMN,
+    ADD_DECISIONS_CREATED_AT_COLUMN,
+    ADD_DECISIONS_DAY_KEY_COLUMN,
+    ADD_DECISIONS_PROPOSAL_ID_COLUMN,
+    BACKFILL_DECISIONS_CREATED_AT,
+    LEGACY_TEXT_TIMESTAMP_INDEXES,
+    ADD_HISTORY_DELTA_COLUMN,
+    BACKFILL_PROPOSAL_APPROVALS,
+    BACKFILL_PROPOSAL_REJECTIONS,
+    ADD_HISTORY_KEYFRAME_COLUMN,
+    CREATE_SEARCH_TERM_TRIGRAMS_TABLE
 )
 
+settings = get_settings()
+
 # Database file path
-DB_DIR = Path("data")
-DB_PATH = DB_DIR / "decisionnote.db"
+DB_PATH = Path(settings.database_path)
+DB_DIR = DB_PATH.parent
+
+# Statements that only read and can be served by a pooled reader connection
+READ_ONLY_PREFIXES = ("SELECT", "WITH", "EXPLAIN")
+
+# Per-connection PRAGMA profiles (DATABASE_PRAGMA_PROFILE). All of them run in
+# WAL mode so readers never block the writer; they differ in how much
+# durability is traded for write throughput and how much memory is used.
+PRAGMA_PROFILES = {
+    # fsync on every commit; survives power loss without losing a transaction
+    "durable": {
+        "synchronous": "FULL",
+        "cache_size": -16000,  # ~16 MB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    # fsync only at checkpoints; a power loss may drop the last few commits
+    "balanced": {
+        "synchronous": "NORMAL",
+        "cache_size": -64000,  # ~64 MB
+        "mmap_size": 268435456,  # 256 MB
+        "temp_store": "MEMORY",
+    },
+    # No fsync at all; an OS crash may lose recent commits
+    "throughput": {
+        "synchronous": "OFF",
+        "cache_size": -256000,  # ~256 MB
+        "mmap_size": 1073741824,  # 1 GB
+        "temp_store": "MEMORY",
+    },
+}
+
+
+async def apply_pragmas(db: aiosqlite.Connection, profile: str):
+    """
+    Apply the journal mode, busy timeout and PRAGMA profile to a connection
+    """
+    await db.execute("PRAGMA journal_mode = WAL")
+    await db.execute(f"PRAGMA busy_timeout = {int(settings.database_busy_timeout_ms)}")
+    # Checkpoints are run by the app (see WalCheckpointer); the commit-time
+    # one only kicks in at a much larger WAL, in case the app's fall behind
+    await db.execute(f"PRAGMA wal_autocheckpoint = {int(settings.wal_autocheckpoint_pages)}")
+    for name, value in PRAGMA_PROFILES[profile].items():
+        await db.execute(f"PRAGMA {name} = {value}")
+
+
+class ConnectionPool:
+    """
+    Long-lived SQLite connections shared by the whole process.
+
+    Holds a fixed set of read connections handed out round-robin through a
+    queue, plus one dedicated writer connection guarded by a lock so that
+    only one coroutine writes at a time.
+    """
+
+    def __init__(self, db_path: Path, size: int, pragma_profile: str = "balanced"):
+        self.db_path = db_path
+        self.size = max(size, 1)
+        self.pragma_profile = pragma_profile
+        self._readers: asyncio.Queue = asyncio.Queue()
+        self._connections: List[aiosqlite.Connection] = []
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """
+        Open a single connection with name-based row access
+        """
+        # Autocommit mode: transactions are opened explicitly with BEGIN
+        db = await aiosqlite.connect(self.db_path, isolation_level=None)
+        db.row_factory = aiosqlite.Row  # Enable column access by name
+        await apply_pragmas(db, self.pragma_profile)
+        self._connections.append(db)
+        return db
+
+    async def open(self):
+        """
+        Open the reader connections and the writer connection
+        """
+        for _ in range(self.size):
+            self._readers.put_nowait(await self._connect())
+        self._writer = await self._connect()
+
+    async def close(self):
+        """
+        Close every connection owned by the pool
+        """
+        for db in self._connections:
+            await db.close()
+        self._connections.clear()
+        self._writer = None
+
+    @asynccontextmanager
+    async def reader(self):
+        """
+        Borrow a read connection for the duration of the block
+        """
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            self._readers.put_nowait(db)
+
+    @asynccontextmanager
+    async def writer(self):
+        """
+        Get exclusive access to the writer connection
+        """
+        async with self._write_lock:
+            yield self._writer
+
+
+WriteOperation = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+
+class WriteQueue:
+    """
+    Single-writer actor that group-commits queued write operations.
+
+    Callers submit an async operation that receives the writer connection
+    and await its result. The actor drains whatever is queued (up to
+    max_batch_size, waiting at most max_delay for stragglers) and runs the
+    batch in one transaction, so the whole batch pays a single commit.
+    Each operation runs inside its own savepoint: a failing operation is
+    rolled back and reported to its caller without aborting the others.
+    A batch that fails as a whole (no writer connection, a failed BEGIN or
+    COMMIT) fails every caller in it, and the actor moves on to the next.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_batch_size: int, max_delay: float):
+        self.pool = pool
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_delay = max(max_delay, 0.0)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """
+        Start the writer task
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Flush pending writes and stop the writer task
+        """
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+    async def submit(self, operation: WriteOperation, bump_generation: bool = True) -> Any:
+        """
+        Queue a write operation and wait until its batch is committed
+
+        A batch bumps the write generation only if one of its successful
+        operations asked for it.
+
+        Raises:
+            RuntimeError: If the writer task is not running
+        """
+        if self._task is None or self._task.done():
+            raise RuntimeError("Write queue is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, future, bump_generation))
+        return await future
+
+    def _drain(self, batch: list) -> bool:
+        """
+        Move already-queued operations into the batch; returns False on shutdown
+        """
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is None:
+                return False
+            batch.append(item)
+        return True
+
+    @staticmethod
+    def _fail(batch: list, error: BaseException):
+        """
+        Report an error to every caller in the batch still waiting
+        """
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _run(self):
+        running = True
+        try:
+            while running:
+                item = await self._queue.get()
+                if item is None:
+                    break
+
+                batch = [item]
+                try:
+                    running = self._drain(batch)
+                    if running and len(batch) < self.max_batch_size and self.max_delay:
+                        # Hold the commit window open briefly so concurrent writers share it
+                        await asyncio.sleep(self.max_delay)
+                        running = self._drain(batch)
+
+                    await self._commit_batch(batch)
+                except Exception as e:
+                    print(f"⚠️ Write batch of {len(batch)} failed: {e}")
+                    self._fail(batch, e)
+        finally:
+            # Never leave a caller waiting on a writer that is gone
+            leftover = []
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not None:
+                    leftover.append(item)
+            self._fail(leftover, RuntimeError("Write queue stopped"))
+
+    async def _commit_batch(self, batch: list):
+        results = []
+        bump_generation = False
+
+        async with self.pool.writer() as db:
+            try:
+                await db.execute("BEGIN IMMEDIATE")
+                for operation, future, bumps in batch:
+                    await db.execute("SAVEPOINT queued_write")
+                    try:
+                        result = await operation(db)
+                    except Exception as e:
+                        await db.execute("ROLLBACK TO queued_write")
+                        await db.execute("RELEASE queued_write")
+                        results.append((future, None, e))
+                    else:
+                        await db.execute("RELEASE queued_write")
+                        results.append((future, result, None))
+                        bump_generation = bump_generation or bumps
+                await db.execute("COMMIT")
+                if bump_generation:
+                    _bump_write_generation()
+            except Exception as e:
+                print(f"⚠️ Write batch of {len(batch)} failed: {e}")
+                if db is not None and db.in_transaction:
+                    await db.execute("ROLLBACK")
+                results = [(future, None, e) for _, future, _ in batch]
+
+        for future, result, error in results:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+class WalCheckpointer:
+    """
+    Background task that checkpoints the WAL on a fixed interval.
+
+    Auto-checkpointing is pushed out to WAL_AUTOCHECKPOINT_PAGES on every
+    pooled connection, so normally the app decides when the WAL is copied
+    back into the database file. Periodic checkpoints are PASSIVE and never
+    wait on readers. Under steady reads a PASSIVE checkpoint may never catch
+    up and the WAL keeps growing, so once it reaches truncate_pages frames
+    the checkpoint is escalated to TRUNCATE, which waits for readers (up to
+    the busy timeout) and resets the WAL file. The final checkpoint at
+    shutdown always truncates.
+    """
+
+    def __init__(self, pool: ConnectionPool, interval: float, truncate_pages: int):
+        self.pool = pool
+        self.interval = interval
+        self.truncate_pages = truncate_pages
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """
+        Start the checkpoint loop (disabled when the interval is not positive)
+        """
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the loop and fold the whole WAL back into the database file
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.checkpoint("TRUNCATE")
+
+    async def checkpoint(self, mode: str = "PASSIVE") -> Optional[int]:
+        """
+        Run a single WAL checkpoint on the writer connection
+
+        Returns:
+            Frames in the WAL when the checkpoint ran (None if it failed)
+        """
+        try:
+            async with self.pool.writer() as db:
+                cursor = await db.execute(f"PRAGMA wal_checkpoint({mode})")
+                _busy, wal_frames, _checkpointed = await cursor.fetchone()
+                return wal_frames
+        except Exception as e:
+            print(f"⚠️ WAL checkpoint ({mode}) failed: {e}")
+            return None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            wal_frames = await self.checkpoint()
+            if wal_frames is not None and self.truncate_pages > 0 and wal_frames >= self.truncate_pages:
+                await self.checkpoint("TRUNCATE")
+
+
+_pool: Optional[ConnectionPool] = None
+_write_queue: Optional[WriteQueue] = None
+_checkpointer: Optional[WalCheckpointer] = None
+_pool_lock = asyncio.Lock()
+
+# Bumped after every committed write; cached reads tagged with an older
+# generation are treated as stale
+_write_generation = 0
+
+
+def get_write_generation() -> int:
+    """
+    Current write generation (monotonically increasing)
+    """
+    return _write_generation
+
+
+def _bump_write_generation():
+    global _write_generation
+    _write_generation += 1
+
+
+async def open_pool() -> ConnectionPool:
+    """
+    Open the process-wide connection pool and start its writer (idempotent)
+    """
+    global _pool, _write_queue, _checkpointer
+
+    async with _pool_lock:
+        if _pool is None:
+            pool = ConnectionPool(
+                DB_PATH,
+                settings.database_pool_size,
+                pragma_profile=settings.database_pragma_profile
+            )
+            await pool.open()
+            write_queue = WriteQueue(
+                pool,
+                max_batch_size=settings.write_batch_max_size,
+                max_delay=settings.write_batch_max_delay_ms / 1000
+            )
+            write_queue.start()
+            checkpointer = WalCheckpointer(
+                pool,
+                settings.wal_checkpoint_interval_seconds,
+                truncate_pages=settings.wal_truncate_threshold_pages
+            )
+            checkpointer.start()
+            _pool, _write_queue, _checkpointer = pool, write_queue, checkpointer
+            print(
+                f"✅ Database pool opened ({pool.size} readers + 1 writer, "
+                f"'{pool.pragma_profile}' profile)"
+            )
+
+    return _pool
+
+
+async def close_pool():
+    """
+    Flush queued writes and close the process-wide connection pool
+    """
+    global _pool, _write_queue, _checkpointer
+
+    async with _pool_lock:
+        if _write_queue is not None:
+            await _write_queue.stop()
+            _write_queue = None
+        if _checkpointer is not None:
+            await _checkpointer.stop()
+            _checkpointer = None
+        if _pool is not None:
+            await _pool.close()
+            _pool = None
+
+
+async def get_pool() -> ConnectionPool:
+    """
+    Get the connection pool, opening it lazily when used outside the app lifespan
+    """
+    if _pool is not None:
+        return _pool
+    return await open_pool()
 
 
 async def get_db():
     """
     Get database connection (async context manager)
     """
-    db = await aiosqlite.connect(DB_PATH)
-    db.row_factory = aiosqlite.Row  # Enable column access by name
-    try:
+    pool = await get_pool()
+    async with pool.reader() as db:
         yield db
-    finally:
-        await db.close()
 
 
 async def init_database():
@@ -35,46 +464,371 @@ async def init_database():
     Initialize database with required tables
     """
     # Create data directory if it doesn't exist
-    DB_DIR.mkdir(exist_ok=True)
-    
+    DB_DIR.mkdir(parents=True, exist_ok=True)
+
     async with aiosqlite.connect(DB_PATH) as db:
+        # WAL is persistent in the database file; set it before creating tables
+        await apply_pragmas(db, settings.database_pragma_profile)
+
         # Create tables
         await db.execute(CREATE_DECISIONS_TABLE)
         await db.execute(CREATE_PROPOSED_DECISIONS_TABLE)
         await db.execute(CREATE_DECISION_HISTORY_TABLE)
-        
-        # Create indexes
+        await db.execute(CREATE_PROPOSAL_VOTES_TABLE)
+        await db.execute(CREATE_VALIDATION_CACHE_TABLE)
+
+        # Full-text search index and the triggers that keep it in sync
+        await db.execute(CREATE_DECISIONS_FTS_TABLE)
+        await db.execute(CREATE_DECISIONS_FTS_INSERT_TRIGGER)
+        await db.execute(CREATE_DECISIONS_FTS_UPDATE_TRIGGER)
+        await db.execute(CREATE_DECISIONS_FTS_DELETE_TRIGGER)
+
+        # Vocabulary trigrams for typo-tolerant search
+        await db.execute(CREATE_SEARCH_TERM_TRIGRAMS_TABLE)
+
+        await db.commit()
+
+        # Bring data in older databases up to the current schema version
+        await run_migrations(db)
+
+        # Create indexes (after migrations: some cover columns they add)
         await db.execute(CREATE_DECISIONS_INDEX)
+        await db.execute(CREATE_DECISIONS_DAY_INDEX)
         await db.execute(CREATE_DECISIONS_USER_INDEX)
+        await db.execute(CREATE_DECISIONS_TOPIC_INDEX)
+        await db.execute(CREATE_DECISIONS_PROPOSAL_INDEX)
         await db.execute(CREATE_PROPOSED_STATUS_INDEX)
-        
+        await db.execute(CREATE_PROPOSAL_VOTES_TALLY_INDEX)
+        await db.execute(CREATE_DECISION_HISTORY_INDEX)
         await db.commit()
+
         print("✅ Database initialized successfully")
 
 
+async def _backfill_decisions_fts(db: aiosqlite.Connection):
+    """
+    Index decisions that were stored before the FTS table existed
+    """
+    await db.execute(REBUILD_DECISIONS_FTS)
+
+
+async def _drop_legacy_timestamp_index(db: aiosqlite.Connection):
+    """
+    Remove the timestamp-only index replaced by the (timestamp, id) index
+    """
+    await db.execute(DROP_LEGACY_DECISIONS_TIMESTAMP_INDEX)
+
+
+async def _drop_legacy_user_index(db: aiosqlite.Connection):
+    """
+    Remove the user-only index replaced by the (user, timestamp, id) index
+    """
+    await db.execute(DROP_LEGACY_DECISIONS_USER_INDEX)
+
+
+async def _column_exists(db: aiosqlite.Connection, table: str, column: str) -> bool:
+    """
+    Check whether a table already has a column
+    """
+    cursor = await db.execute(f"PRAGMA table_info({table})")
+    return any(row[1] == column for row in await cursor.fetchall())
+
+
+async def _backfill_decision_embeddings(db: aiosqlite.Connection):
+    """
+    Add the embedding column and embed every existing decision
+    """
+    from services.similarity_service import embed_text, vector_to_blob
+
+    if not await _column_exists(db, "decisions", "embedding"):
+        await db.execute(ADD_DECISIONS_EMBEDDING_COLUMN)
+
+    while True:
+        cursor = await db.execute(
+            "SELECT id, text FROM decisions WHERE embedding IS NULL LIMIT 1000"
+        )
+        rows = await cursor.fetchall()
+        if not rows:
+            break
+        await db.executemany(
+            "UPDATE decisions SET embedding = ? WHERE id = ?",
+            [(vector_to_blob(embed_text(text)), decision_id) for decision_id, text in rows]
+        )
+
+
+async def _backfill_search_term_trigrams(db: aiosqlite.Connection):
+    """
+    Index the vocabulary of decisions stored before the trigram table existed
+    """
+    from services.trigram_service import TrigramService
+
+    last_id = 0
+    while True:
+        cursor = await db.execute(
+            "SELECT id, text FROM decisions WHERE id > ? ORDER BY id LIMIT 1000",
+            (last_id,)
+        )
+        rows = await cursor.fetchall()
+        if not rows:
+            break
+        for decision_id, text in rows:
+            await TrigramService.index_terms(db, text)
+        last_id = rows[-1][0]
+
+
+async def _backfill_epoch_timestamps(db: aiosqlite.Connection):
+    """
+    Add created_at / day_key, derive them from the text timestamps and drop
+    the indexes over the text column
+    """
+    from utils.clock import day_key, from_epoch
+
+    if not await _column_exists(db, "decisions", "created_at"):
+        await db.execute(ADD_DECISIONS_CREATED_AT_COLUMN)
+    if not await _column_exists(db, "decisions", "day_key"):
+        await db.execute(ADD_DECISIONS_DAY_KEY_COLUMN)
+
+    await db.execute(BACKFILL_DECISIONS_CREATED_AT)
+
+    cursor = await db.execute("SELECT id, created_at FROM decisions WHERE day_key IS NULL")
+    rows = await cursor.fetchall()
+    await db.executemany(
+        "UPDATE decisions SET day_key = ? WHERE id = ?",
+        [(day_key(from_epoch(created_at)), decision_id) for decision_id, created_at in rows]
+    )
+
+    for index_name in LEGACY_TEXT_TIMESTAMP_INDEXES:
+        await db.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+async def _delta_encode_history(db: aiosqlite.Connection):
+    """
+    Re-encode stored full-text history rows as deltas with periodic keyframes
+    """
+    from services.decision_service import DecisionService
+
+    if not await _column_exists(db, "decision_history", "delta"):
+        await db.execute(ADD_HISTORY_DELTA_COLUMN)
+    if not await _column_exists(db, "decision_history", "is_keyframe"):
+        await db.execute(ADD_HISTORY_KEYFRAME_COLUMN)
+
+    cursor = await db.execute("SELECT DISTINCT decision_id FROM decision_history")
+    decision_ids = [row[0] for row in await cursor.fetchall()]
+
+    for decision_id in decision_ids:
+        cursor = await db.execute("SELECT text FROM decisions WHERE id = ?", (decision_id,))
+        current = await cursor.fetchone()
+        if not current:
+            continue
+
+        cursor = await db.execute(
+            "SELECT id, text FROM decision_history WHERE decision_id = ? ORDER BY edited_at, id",
+            (decision_id,)
+        )
+        rows = await cursor.fetchall()
+
+        # Walk newest to oldest: each row is encoded against the version after it
+        updates = []
+        next_text = current[0]
+        for edit_number in range(len(rows), 0, -1):
+            history_id, text = rows[edit_number - 1]
+            stored_text, delta, is_keyframe = DecisionService.encode_history_entry(text, next_text, edit_number)
+            updates.append((stored_text, delta, is_keyframe, history_id))
+            next_text = text
+
+        await db.executemany(
+            "UPDATE decision_history SET text = ?, delta = ?, is_keyframe = ? WHERE id = ?",
+            updates
+        )
+
+
+async def _backfill_proposal_votes(db: aiosqlite.Connection):
+    """
+    Move votes from the JSON arrays on proposed_decisions into proposal_votes
+    """
+    await db.execute(BACKFILL_PROPOSAL_APPROVALS)
+    await db.execute(BACKFILL_PROPOSAL_REJECTIONS)
+
+
+async def _add_decision_proposal_link(db: aiosqlite.Connection):
+    """
+    Add the decisions.proposal_id back-reference to approved proposals
+    """
+    if not await _column_exists(db, "decisions", "proposal_id"):
+        await db.execute(ADD_DECISIONS_PROPOSAL_ID_COLUMN)
+
+
+async def _normalize_proposal_expiry(db: aiosqlite.Connection):
+    """
+    Pin the UTC offset on naive proposal expires_at values
+
+    Older proposals stored datetime.now() without an offset, i.e. in the
+    server's local time. Naive values are now read as team-timezone times,
+    so they are rewritten as aware timestamps in the server's local zone.
+    """
+    cursor = await db.execute("SELECT id, expires_at FROM proposed_decisions WHERE expires_at IS NOT NULL")
+    rows = await cursor.fetchall()
+
+    updates = []
+    for proposal_id, expires_at in rows:
+        moment = datetime.fromisoformat(expires_at)
+        if moment.tzinfo is None:
+            updates.append((moment.astimezone().isoformat(), proposal_id))
+
+    await db.executemany("UPDATE proposed_decisions SET expires_at = ? WHERE id = ?", updates)
+
+
+# One-time data migrations, tracked through PRAGMA user_version.
+# Append new entries with the next version number; never reorder them.
+MIGRATIONS = [
+    (1, _backfill_decisions_fts),
+    (2, _drop_legacy_timestamp_index),
+    (3, _backfill_decision_embeddings),
+    (4, _backfill_search_term_trigrams),
+    (5, _drop_legacy_user_index),
+    (6, _backfill_epoch_timestamps),
+    (7, _delta_encode_history),
+    (8, _backfill_proposal_votes),
+    (9, _add_decision_proposal_link),
+    (10, _normalize_proposal_expiry),
+]
+
+
+async def run_migrations(db: aiosqlite.Connection):
+    """
+    Apply every migration newer than the database's user_version
+    """
+    cursor = await db.execute("PRAGMA user_version")
+    current_version = (await cursor.fetchone())[0]
+
+    for version, migrate in MIGRATIONS:
+        if version <= current_version:
+            continue
+        await migrate(db)
+        await db.execute(f"PRAGMA user_version = {version}")
+        await db.commit()
+        print(f"✅ Applied database migration {version} ({migrate.__name__})")
+
+
+async def get_database_status() -> dict:
+    """
+    Describe the active database configuration for the health endpoint
+    """
+    pool = await get_pool()
+    async with pool.reader() as db:
+        cursor = await db.execute("PRAGMA journal_mode")
+        journal_mode = (await cursor.fetchone())[0]
+
+    return {
+        "pragma_profile": pool.pragma_profile,
+        "journal_mode": journal_mode,
+        "busy_timeout_ms": settings.database_busy_timeout_ms,
+        "pool_size": pool.size,
+        "wal_checkpoint_interval_seconds": settings.wal_checkpoint_interval_seconds
+    }
+
+
+def is_read_only(query: str) -> bool:
+    """
+    Check whether a statement can run on a read connection
+    """
+    return query.lstrip().upper().startswith(READ_ONLY_PREFIXES)
+
+
+@asynccontextmanager
+async def transaction():
+    """
+    Unit of work on the writer connection
+
+    Yields the writer connection inside BEGIN IMMEDIATE and commits when
+    the block exits, or rolls back if the block or the COMMIT itself raises,
+    so the shared writer is never left inside a transaction. The write lock
+    is held for the whole block, so reads inside it see a stable snapshot
+    and no other writer can interleave.
+
+    Usage:
+        async with transaction() as db:
+            await db.execute(...)
+    """
+    pool = await get_pool()
+
+    async with pool.writer() as db:
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+            await db.execute("COMMIT")
+        except BaseException:
+            if db.in_transaction:
+                await db.execute("ROLLBACK")
+            raise
+        _bump_write_generation()
+
+
+@asynccontextmanager
+async def read_snapshot():
+    """
+    Read connection inside a transaction
+
+    Every statement in the block sees the same snapshot of the database,
+    so multi-query reads are consistent even while writes commit.
+
+    Usage:
+        async with read_snapshot() as db:
+            await db.execute(...)
+    """
+    pool = await get_pool()
+
+    async with pool.reader() as db:
+        await db.execute("BEGIN")
+        try:
+            yield db
+        finally:
+            await db.execute("COMMIT")
+
+
+async def submit_write(operation: WriteOperation, bump_generation: bool = True) -> Any:
+    """
+    Run a write operation on the writer connection through the group-commit queue
+
+    Args:
+        operation: Async callable receiving the writer connection
+        bump_generation: Whether the write can change what cached reads
+            return; pass False for tables no cached query reads
+
+    Returns:
+        Whatever the operation returns, once its batch has committed
+    """
+    await get_pool()
+    return await _write_queue.submit(operation, bump_generation)
+
+
 async def execute_query(query: str, params: tuple = (), fetch_one: bool = False):
     """
     Execute a database query
     """
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    if is_read_only(query):
+        pool = await get_pool()
+        async with pool.reader() as db:
+            cursor = await db.execute(query, params)
+            if fetch_one:
+                return await cursor.fetchone()
+            return await cursor.fetchall()
+
+    async def operation(db: aiosqlite.Connection):
         cursor = await db.execute(query, params)
-        
         if fetch_one:
-            result = await cursor.fetchone()
-        else:
-            result = await cursor.fetchall()
-        
-        await db.commit()
-        return result
+            return await cursor.fetchone()
+        return await cursor.fetchall()
+
+    return await submit_write(operation)
 
 
 async def execute_insert(query: str, params: tuple = ()):
     """
     Execute an INSERT query and return the last inserted row ID
     """
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def operation(db: aiosqlite.Connection):
         cursor = await db.execute(query, params)
-        await db.commit()
         return cursor.lastrowid
-        
\ No newline at end of file
+
+    return await submit_write(operation)
@@ -4,8 +4,14 @@ DecisionNote Agent - Main FastAPI Application
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.database import init_database
-from routes import a2a, triggers, well_known
+from app.database import init_database, open_pool, close_pool, get_database_status
+from app.cache import get_cache_status
+from routes import a2a, triggers, well_known, maintenance
+from services.similarity_service import SimilarityService
+from services.duplicate_service import DuplicateService
+from services.expiry_service import ExpiryService
+from services.validation_cache_service import ValidationCacheService
+from services.gemini_service import get_llm_status, get_router, get_validation_status
 from app.config import get_settings
 
 settings = get_settings()
@@ -19,12 +25,19 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting DecisionNote Agent...")
     await init_database()
+    await open_pool()
+    await SimilarityService.load_index()
+    await DuplicateService.load_index()
+    await ExpiryService.start()
+    get_router()  # Fails fast on a misconfigured LLM provider
     print("✅ DecisionNote Agent ready!")
     
     yield
     
     # Shutdown
     print("👋 Shutting down DecisionNote Agent...")
+    await ExpiryService.stop()
+    await close_pool()
 
 
 # Create FastAPI app
@@ -48,6 +61,7 @@ app.add_middleware(
 app.include_router(a2a.router, tags=["A2A Protocol"])
 app.include_router(triggers.router, tags=["Triggers"])
 app.include_router(well_known.router, tags=["Discovery"])
+app.include_router(maintenance.router, tags=["Maintenance"])
 
 
 @app.get("/")
@@ -70,7 +84,12 @@ async def health_check():
     """
     return {
         "status": "healthy",
-        "service": "decisionnote-agent"
+        "service": "decisionnote-agent",
+        "database": await get_database_status(),
+        "result_cache": get_cache_status(),
+        "llm": get_llm_status(),
+        "validation": get_validation_status(),
+        "validation_cache": ValidationCacheService.get_status()
     }
 
 
@@ -1,9 +1,9 @@
 """
 Pydantic models for A2A protocol and Telex integration
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional, List, Dict, Any, Union
-from datetime import datetime
+from datetime import date, datetime
 from uuid import uuid4
 
 # ===== A2A Core Models =====
@@ -153,3 +153,34 @@ class DecisionHistory(BaseModel):
     text: str
     edited_by: str
     edited_at: datetime = Field(default_factory=datetime.now)
+    diff: Optional[str] = None  # Inline diff to the next version, when requested
+
+class DecisionPage(BaseModel):
+    """
+    One page of decisions plus the cursor for the next page
+    """
+    decisions: List[Any]  # DecisionRecord rows (app/records.py), formatted without conversion
+    next_cursor: Optional[str] = None
+    fuzzy: bool = False  # Search results came from the typo-tolerant tier
+    facets: Dict[str, Dict[str, int]] = {}  # Search only: counts per user / topic
+
+class SearchFilters(BaseModel):
+    """
+    Facet filters for decision search (dates are inclusive)
+    """
+    model_config = ConfigDict(frozen=True)  # Hashable, so searches can be cached
+    
+    user: Optional[str] = None
+    topic: Optional[str] = None
+    since: Optional[date] = None
+    until: Optional[date] = None
+    
+    def is_active(self) -> bool:
+        return any(value is not None for value in (self.user, self.topic, self.since, self.until))
+
+class DecisionHistoryPage(BaseModel):
+    """
+    One page of a decision's edit history plus the cursor for the next page
+    """
+    history: List[DecisionHistory]
+    next_cursor: Optional[str] = None
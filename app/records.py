@@ -0,0 +1,179 @@
+"""
+Row mapping from database rows to records and models
+
+Rows read back from our own tables are trusted: the schema already fixes
+their shape, so running full pydantic validation on every row only costs
+time. Rows are mapped once into compact `__slots__` records. Pages of
+decisions carry the records all the way to the formatters; single rows
+handed out of the service layer become pydantic models through
+`model_construct`, with every field filled from the record.
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.models import Decision, DecisionHistory, ProposedDecision
+from utils.clock import from_epoch, from_utc
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a stored ISO timestamp, passing NULL through
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
+class Record(ABC):
+    """
+    Base for slotted row records; subclasses name their model and fields
+    """
+    __slots__ = ()
+    model = None
+
+    @staticmethod
+    @abstractmethod
+    def parse(row) -> tuple:
+        """
+        Field values of a row, in __slots__ order
+        """
+
+    @classmethod
+    def from_row(cls, row) -> "Record":
+        return cls(*cls.parse(row))
+
+    @classmethod
+    def model_from_row(cls, row):
+        """
+        Map a row straight to the pydantic model, skipping the record
+        """
+        return cls.model.model_construct(**dict(zip(cls.__slots__, cls.parse(row))))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_model(self):
+        """
+        Convert to the pydantic model without re-validating
+        """
+        return self.model.model_construct(**self.as_dict())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class DecisionRecord(Record):
+    """
+    A row of the decisions table
+    """
+    __slots__ = (
+        "id", "text", "original_text", "user", "last_edited_by", "last_edited_at",
+        "timestamp", "edit_count", "topic", "metadata"
+    )
+    model = Decision
+
+    def __init__(self, id, text, original_text, user, last_edited_by, last_edited_at,
+                 timestamp, edit_count, topic, metadata):
+        self.id = id
+        self.text = text
+        self.original_text = original_text
+        self.user = user
+        self.last_edited_by = last_edited_by
+        self.last_edited_at = last_edited_at
+        self.timestamp = timestamp
+        self.edit_count = edit_count
+        self.topic = topic
+        self.metadata = metadata
+
+    @staticmethod
+    def parse(row) -> tuple:
+        return (
+            row['id'],
+            row['text'],
+            row['original_text'],
+            row['user'],
+            row['last_edited_by'],
+            parse_timestamp(row['last_edited_at']),
+            from_epoch(row['created_at']),
+            row['edit_count'],
+            row['topic'],
+            row['metadata']
+        )
+
+
+class ProposalRecord(Record):
+    """
+    A row of the proposed_decisions table
+
+    The vote lists start empty; VotingService fills them from proposal_votes.
+    """
+    __slots__ = (
+        "id", "text", "proposer", "timestamp", "approvals", "rejections",
+        "status", "threshold", "expires_at"
+    )
+    model = ProposedDecision
+
+    def __init__(self, id, text, proposer, timestamp, approvals, rejections,
+                 status, threshold, expires_at):
+        self.id = id
+        self.text = text
+        self.proposer = proposer
+        self.timestamp = timestamp
+        self.approvals = approvals
+        self.rejections = rejections
+        self.status = status
+        self.threshold = threshold
+        self.expires_at = expires_at
+
+    @staticmethod
+    def parse(row) -> tuple:
+        return (
+            row['id'],
+            row['text'],
+            row['proposer'],
+            datetime.fromisoformat(row['timestamp']),
+            [],
+            [],
+            row['status'],
+            row['threshold'],
+            parse_timestamp(row['expires_at'])
+        )
+
+
+class DecisionHistoryRecord(Record):
+    """
+    A row of the decision_history table
+
+    `edited_at` is stored as UTC text by CURRENT_TIMESTAMP and mapped into
+    the team's timezone, like the decisions' created_at. `text` is only the
+    stored text; delta rows need the version rebuilt by DecisionService
+    before it is meaningful.
+    """
+    __slots__ = ("id", "decision_id", "text", "edited_by", "edited_at", "diff")
+    model = DecisionHistory
+
+    def __init__(self, id, decision_id, text, edited_by, edited_at, diff=None):
+        self.id = id
+        self.decision_id = decision_id
+        self.text = text
+        self.edited_by = edited_by
+        self.edited_at = edited_at
+        self.diff = diff
+
+    @staticmethod
+    def parse(row) -> tuple:
+        return (
+            row['id'],
+            row['decision_id'],
+            row['text'],
+            row['edited_by'],
+            from_utc(datetime.fromisoformat(row['edited_at'])),
+            None
+        )
+
+
+def decisions_from_rows(rows: Sequence) -> List[DecisionRecord]:
+    """
+    Map decisions rows to records
+    """
+    return [DecisionRecord.from_row(row) for row in rows]
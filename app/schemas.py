@@ -15,7 +15,11 @@ CREATE TABLE IF NOT EXISTS decisions (
     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
     edit_count INTEGER DEFAULT 0,
     topic TEXT,
-    metadata TEXT
+    metadata TEXT,
+    embedding BLOB,
+    created_at INTEGER,
+    day_key INTEGER,
+    proposal_id INTEGER REFERENCES proposed_decisions (id)
 );
 """
 
@@ -33,6 +37,30 @@ CREATE TABLE IF NOT EXISTS proposed_decisions (
 );
 """
 
+# One row per voter; re-voting overwrites the row. The approvals and
+# rejections JSON columns of proposed_decisions are legacy and unused.
+CREATE_PROPOSAL_VOTES_TABLE = """
+CREATE TABLE IF NOT EXISTS proposal_votes (
+    proposal_id INTEGER NOT NULL,
+    user TEXT NOT NULL,
+    vote TEXT NOT NULL CHECK (vote IN ('approve', 'reject')),
+    voted_at INTEGER NOT NULL,
+    PRIMARY KEY (proposal_id, user),
+    FOREIGN KEY (proposal_id) REFERENCES proposed_decisions (id)
+) WITHOUT ROWID;
+"""
+
+# LLM validation answers keyed by normalized text (see ValidationCacheService)
+CREATE_VALIDATION_CACHE_TABLE = """
+CREATE TABLE IF NOT EXISTS validation_cache (
+    text_key TEXT PRIMARY KEY,
+    prompt_version TEXT NOT NULL,
+    is_valid INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    cached_at INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
 CREATE_DECISION_HISTORY_TABLE = """
 CREATE TABLE IF NOT EXISTS decision_history (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,22 +68,183 @@ CREATE TABLE IF NOT EXISTS decision_history (
     text TEXT NOT NULL,
     edited_by TEXT NOT NULL,
     edited_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    delta TEXT,
+    is_keyframe INTEGER NOT NULL DEFAULT 1,
     FOREIGN KEY (decision_id) REFERENCES decisions (id)
 );
 """
 
-# Index for faster queries
+# Each history row is the text a decision had before one edit. Keyframes
+# store it in full in `text`; the rows in between store only `delta`, the
+# version encoded against the next (newer) version, and an empty `text`.
+
+# created_at is Unix epoch seconds and day_key the YYYYMMDD calendar day in
+# SUMMARY_TIMEZONE, both set on insert. The legacy `timestamp` text column
+# (UTC, filled by its default) is kept but no longer read or indexed.
+
+# Index for faster queries. Includes id so (created_at, id) keyset
+# pagination is served straight from the index without a sort step.
 CREATE_DECISIONS_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_decisions_timestamp 
-ON decisions(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_decisions_created_id 
+ON decisions(created_at DESC, id DESC);
 """
 
+# "Today's decisions" is an equality lookup on the day bucket
+CREATE_DECISIONS_DAY_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_decisions_day_created 
+ON decisions(day_key, created_at DESC, id DESC);
+"""
+
+# Superseded by idx_decisions_created_id
+DROP_LEGACY_DECISIONS_TIMESTAMP_INDEX = """
+DROP INDEX IF EXISTS idx_decisions_timestamp;
+"""
+
+# Composite indexes for faceted search: an equality filter on user or
+# topic followed by a (created_at, id) range, newest first
 CREATE_DECISIONS_USER_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_decisions_user 
-ON decisions(user);
+CREATE INDEX IF NOT EXISTS idx_decisions_user_created 
+ON decisions(user, created_at DESC, id DESC);
+"""
+
+CREATE_DECISIONS_TOPIC_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_decisions_topic_created 
+ON decisions(topic, created_at DESC, id DESC);
+"""
+
+# Superseded by idx_decisions_user_timestamp (itself superseded below)
+DROP_LEGACY_DECISIONS_USER_INDEX = """
+DROP INDEX IF EXISTS idx_decisions_user;
+"""
+
+# Indexes over the text `timestamp` column, superseded by the created_at ones
+LEGACY_TEXT_TIMESTAMP_INDEXES = (
+    "idx_decisions_timestamp_id",
+    "idx_decisions_user_timestamp",
+    "idx_decisions_topic_timestamp",
+)
+
+# Tallies are COUNTs over (proposal_id, vote)
+CREATE_PROPOSAL_VOTES_TALLY_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_proposal_votes_tally 
+ON proposal_votes(proposal_id, vote);
+"""
+
+# At most one decision per approved proposal; NULLs (direct adds) don't collide
+CREATE_DECISIONS_PROPOSAL_INDEX = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_decisions_proposal 
+ON decisions(proposal_id);
 """
 
 CREATE_PROPOSED_STATUS_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_proposed_status 
 ON proposed_decisions(status);
 """
+
+CREATE_DECISION_HISTORY_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_history_decision_edited 
+ON decision_history(decision_id, edited_at DESC, id DESC);
+"""
+
+
+# Full-text search index over decision text and topic. External-content
+# table: the text lives in `decisions`, FTS5 only stores the inverted index,
+# which is kept in sync by the triggers below.
+CREATE_DECISIONS_FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS decisions_fts USING fts5(
+    text,
+    topic,
+    content='decisions',
+    content_rowid='id',
+    tokenize='porter unicode61'
+);
+"""
+
+CREATE_DECISIONS_FTS_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS decisions_fts_insert AFTER INSERT ON decisions
+BEGIN
+    INSERT INTO decisions_fts (rowid, text, topic)
+    VALUES (new.id, new.text, new.topic);
+END;
+"""
+
+CREATE_DECISIONS_FTS_UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS decisions_fts_update AFTER UPDATE OF text, topic ON decisions
+BEGIN
+    INSERT INTO decisions_fts (decisions_fts, rowid, text, topic)
+    VALUES ('delete', old.id, old.text, old.topic);
+    INSERT INTO decisions_fts (rowid, text, topic)
+    VALUES (new.id, new.text, new.topic);
+END;
+"""
+
+CREATE_DECISIONS_FTS_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS decisions_fts_delete AFTER DELETE ON decisions
+BEGIN
+    INSERT INTO decisions_fts (decisions_fts, rowid, text, topic)
+    VALUES ('delete', old.id, old.text, old.topic);
+END;
+"""
+
+# Trigrams of every distinct word stored in a decision, used to resolve
+# misspelled search terms to real vocabulary terms
+CREATE_SEARCH_TERM_TRIGRAMS_TABLE = """
+CREATE TABLE IF NOT EXISTS search_term_trigrams (
+    trigram TEXT NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (trigram, term)
+) WITHOUT ROWID;
+"""
+
+# Columns added to existing tables after their first release, applied by
+# migrations to databases created before the column existed
+ADD_DECISIONS_EMBEDDING_COLUMN = """
+ALTER TABLE decisions ADD COLUMN embedding BLOB;
+"""
+
+# Copy the legacy JSON vote arrays into proposal_votes
+BACKFILL_PROPOSAL_APPROVALS = """
+INSERT OR IGNORE INTO proposal_votes (proposal_id, user, vote, voted_at)
+SELECT p.id, votes.value, 'approve', CAST(strftime('%s', p.timestamp) AS INTEGER)
+FROM proposed_decisions p, json_each(p.approvals) votes
+WHERE json_valid(p.approvals);
+"""
+
+BACKFILL_PROPOSAL_REJECTIONS = """
+INSERT OR IGNORE INTO proposal_votes (proposal_id, user, vote, voted_at)
+SELECT p.id, votes.value, 'reject', CAST(strftime('%s', p.timestamp) AS INTEGER)
+FROM proposed_decisions p, json_each(p.rejections) votes
+WHERE json_valid(p.rejections);
+"""
+
+ADD_HISTORY_DELTA_COLUMN = """
+ALTER TABLE decision_history ADD COLUMN delta TEXT;
+"""
+
+ADD_HISTORY_KEYFRAME_COLUMN = """
+ALTER TABLE decision_history ADD COLUMN is_keyframe INTEGER NOT NULL DEFAULT 1;
+"""
+
+ADD_DECISIONS_CREATED_AT_COLUMN = """
+ALTER TABLE decisions ADD COLUMN created_at INTEGER;
+"""
+
+ADD_DECISIONS_DAY_KEY_COLUMN = """
+ALTER TABLE decisions ADD COLUMN day_key INTEGER;
+"""
+
+ADD_DECISIONS_PROPOSAL_ID_COLUMN = """
+ALTER TABLE decisions ADD COLUMN proposal_id INTEGER REFERENCES proposed_decisions (id);
+"""
+
+# The text timestamps were written by CURRENT_TIMESTAMP, i.e. in UTC
+BACKFILL_DECISIONS_CREATED_AT = """
+UPDATE decisions 
+SET created_at = CAST(strftime('%s', timestamp) AS INTEGER)
+WHERE created_at IS NULL;
+"""
+
+# Re-index every existing decision (one-time backfill for older databases)
+REBUILD_DECISIONS_FTS = """
+INSERT INTO decisions_fts (decisions_fts) VALUES ('rebuild');
+"""
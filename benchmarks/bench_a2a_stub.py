@@ -0,0 +1,112 @@
+"""
+Benchmark: load test of the A2A endpoint against the offline stub LLM
+
+Runs the real FastAPI app in-process (lifespan included) on a scratch
+database with LLM_PROVIDER=stub, then fires concurrent `add`, `propose`,
+`list` and `search` commands through /a2a/agent/DecisionNote and reports
+latency percentiles per command. Latency and failure injection come from
+the LLM_STUB_* settings, so runs are repeatable without network access.
+
+Usage:
+    python benchmarks/bench_a2a_stub.py [requests] [concurrency]
+
+    LLM_STUB_LATENCY_MS=800 LLM_STUB_FAILURE_RATE=0.2 \\
+        python benchmarks/bench_a2a_stub.py 400 40
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["LLM_PROVIDER"] = "stub"
+os.environ["DATABASE_PATH"] = str(Path(tempfile.mkdtemp()) / "bench.db")
+
+import httpx
+
+from app.main import app
+from services.gemini_service import get_llm_status, get_validation_status
+
+# Mid-scoring texts go to the (stub) LLM; the rest are settled locally
+TEXTS = [
+    "We will use PostgreSQL for the user database",
+    "Deploy the billing service on Kubernetes",
+    "Quarterly roadmap review notes for the platform team",
+    "Frontend standards for the design system",
+    "Adopt trunk based development for all services",
+    "Weekly sync moved to Thursday mornings",
+    "ok",
+]
+
+
+def command_for(index: int, rng: random.Random) -> str:
+    kind = rng.choice(["add", "add", "propose", "list", "search"])
+    if kind in ("add", "propose"):
+        return f"/decision {kind} {rng.choice(TEXTS)} #{index}"
+    if kind == "search":
+        return "/decision search database"
+    return "/decision list"
+
+
+def a2a_request(index: int, text: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": str(index),
+        "method": "message/send",
+        "params": {
+            "message": {
+                "kind": "message",
+                "role": "user",
+                "parts": [{"kind": "text", "text": text}],
+                "metadata": {"user": f"user{index % 7}"}
+            }
+        }
+    }
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+async def run(total: int, concurrency: int):
+    rng = random.Random(0)
+    commands = [command_for(index, rng) for index in range(total)]
+    latencies = defaultdict(list)
+    slots = asyncio.Semaphore(concurrency)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def send(index: int, text: str):
+                async with slots:
+                    start = time.perf_counter()
+                    response = await client.post("/a2a/agent/DecisionNote", json=a2a_request(index, text))
+                    response.raise_for_status()
+                    latencies[text.split()[1]].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await asyncio.gather(*[send(index, text) for index, text in enumerate(commands)])
+            elapsed = time.perf_counter() - start
+
+        print(f"{total} requests, concurrency {concurrency}: {elapsed:.2f}s ({total / elapsed:.0f} req/s)")
+        for command, samples in sorted(latencies.items()):
+            print(
+                f"  {command:8} n={len(samples):4}  "
+                f"p50={percentile(samples, 0.5) * 1000:7.1f}ms  "
+                f"p95={percentile(samples, 0.95) * 1000:7.1f}ms  "
+                f"max={max(samples) * 1000:7.1f}ms"
+            )
+        print(f"validation: {get_validation_status()}")
+        print(f"llm: {get_llm_status()}")
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(run(total, concurrency))
@@ -0,0 +1,102 @@
+"""
+Benchmark: mapping decisions rows for list and search pages
+
+Compares the old per-row validated `Decision(...)` construction with the
+row mapper in app/records.py, which maps rows to the slotted records that
+list and search pages carry.
+
+Usage:
+    python benchmarks/bench_row_mapping.py [rows]
+"""
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from app.models import Decision
+from app.records import decisions_from_rows
+
+COLUMNS = (
+    "id, text, original_text, user, last_edited_by, last_edited_at, "
+    "timestamp, created_at, edit_count, topic, metadata"
+)
+
+
+def make_rows(count: int) -> list:
+    """
+    Build `count` decisions rows in an in-memory database
+    """
+    db = sqlite3.connect(":memory:")
+    db.row_factory = sqlite3.Row
+    db.execute(f"CREATE TABLE decisions ({COLUMNS})")
+
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    db.executemany(
+        "INSERT INTO decisions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                i,
+                f"Use service {i} for the platform",
+                f"Use service {i}",
+                f"user{i % 20}",
+                "editor" if i % 3 == 0 else None,
+                (start + timedelta(minutes=i, seconds=30)).isoformat() if i % 3 == 0 else None,
+                (start + timedelta(minutes=i)).isoformat(),
+                int((start + timedelta(minutes=i)).timestamp()),
+                i % 3,
+                "infra" if i % 2 else None,
+                None
+            )
+            for i in range(count)
+        ]
+    )
+    return db.execute(f"SELECT {COLUMNS} FROM decisions").fetchall()
+
+
+def validated(rows: list) -> list:
+    """
+    The construction previously copy-pasted across the services
+    """
+    return [
+        Decision(
+            id=row['id'],
+            text=row['text'],
+            original_text=row['original_text'],
+            user=row['user'],
+            last_edited_by=row['last_edited_by'],
+            last_edited_at=datetime.fromisoformat(row['last_edited_at']) if row['last_edited_at'] else None,
+            timestamp=datetime.fromisoformat(row['timestamp']),
+            edit_count=row['edit_count'],
+            topic=row['topic']
+        )
+        for row in rows
+    ]
+
+
+def best_of(func, rows: list, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rows = make_rows(count)
+
+    baseline = best_of(validated, rows)
+    print(f"Mapping {count:,} rows (best of 5)\n")
+    print(f"{'validated Decision(...)':<32}{baseline * 1000:8.1f} ms")
+    elapsed = best_of(decisions_from_rows, rows)
+    print(f"{'decisions_from_rows (records)':<32}{elapsed * 1000:8.1f} ms  {baseline / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
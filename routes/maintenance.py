@@ -0,0 +1,50 @@
+"""
+Maintenance endpoints for corpus-wide housekeeping jobs.
+"""
+from fastapi import APIRouter, Query
+from app.config import get_settings
+from services.decision_service import DecisionService
+from services.duplicate_service import DuplicateService
+from services.gemini_service import VALIDATION_PROMPT_VERSION
+from services.validation_cache_service import ValidationCacheService
+
+router = APIRouter()
+settings = get_settings()
+
+
+@router.get("/maintenance/duplicate-clusters")
+async def find_duplicate_clusters(threshold: float = Query(None, ge=0.0, le=1.0)):
+    """
+    Find clusters of near-duplicate decisions across the whole corpus.
+    Uses the in-memory MinHash LSH index; no table scan and no LLM calls.
+    """
+    threshold = threshold if threshold is not None else settings.duplicate_similarity_threshold
+    clusters = await DuplicateService.find_clusters(threshold)
+
+    decision_ids = [decision_id for cluster in clusters for decision_id in cluster]
+    decisions = await DecisionService.get_decisions_by_ids(decision_ids) if decision_ids else {}
+
+    return {
+        "threshold": threshold,
+        "cluster_count": len(clusters),
+        "clusters": [
+            {
+                "decision_ids": cluster,
+                "decisions": [
+                    {"id": decisions[decision_id].id, "text": decisions[decision_id].text, "user": decisions[decision_id].user}
+                    for decision_id in cluster
+                    if decision_id in decisions
+                ]
+            }
+            for cluster in clusters
+        ]
+    }
+
+
+@router.post("/maintenance/validation-cache/prune")
+async def prune_validation_cache():
+    """
+    Delete cached validations that are past their TTL or from an older prompt.
+    """
+    deleted = await ValidationCacheService.prune(VALIDATION_PROMPT_VERSION)
+    return {"prompt_version": VALIDATION_PROMPT_VERSION, "deleted": deleted}
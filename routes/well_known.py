@@ -107,6 +107,19 @@ async def get_agent_card():
                     )
                 ]
             ),
+            Skill(
+                id="similar-decisions",
+                name="Similar Decisions",
+                description="Finds decisions with similar meaning to a piece of text.",
+                inputModes=["text/plain"],
+                outputModes=["text/plain"],
+                examples=[
+                    SkillExample(
+                        input={"parts": [{"text": "/decision similar \"database choice\""}]},
+                        output={"parts": [{"text": "Decisions similar to 'database choice'..."}]}
+                    )
+                ]
+            ),
             Skill(
                 id="edit-decision",
                 name="Edit Decision",
@@ -5,10 +5,14 @@ from app.models import MessageParams, TaskResult, TaskStatus, A2AMessage, Messag
 from services.decision_service import DecisionService
 from services.voting_service import VotingService
 from services.gemini_service import validate_decision
+from services.llm_client import command_deadline
+from app.config import get_settings
 from utils.parsers import CommandParser
 from utils.formatters import ResponseFormatter
 from uuid import uuid4
 
+settings = get_settings()
+
 async def process_user_message(user_message: A2AMessage) -> TaskResult:
     """
     Processes a single user message and returns a TaskResult.
@@ -28,7 +32,8 @@ async def process_user_message(user_message: A2AMessage) -> TaskResult:
     
     handler = COMMAND_HANDLERS.get(command, handle_unknown_command)
     # Pass the extracted message_text to the handler
-    return await handler(user_message, message_text)
+    with command_deadline(settings.llm_command_deadline_seconds):
+        return await handler(user_message, message_text)
 
 async def handle_message_send(params: MessageParams) -> TaskResult:
     """
@@ -58,27 +63,65 @@ async def handle_execute(params: ExecuteParams) -> TaskResult:
     return await process_user_message(last_user_message)
 
 async def handle_add_command(user_message: A2AMessage, message_text: str) -> TaskResult:
+    message_text, topic = CommandParser.extract_topic(message_text)
     decision_text = CommandParser.extract_decision_text(message_text)
     
     if not decision_text:
         return create_error_response(user_message, "Please provide decision text.")
 
+    validation = await validate_decision(decision_text)
+    if not validation.is_valid:
+        return create_error_response(user_message, ResponseFormatter.format_invalid_decision(validation.reason))
+
     user = (user_message.metadata or {}).get("user", "unknown")
-    decision = await DecisionService.add_decision(decision_text, user)
+    duplicates = await DecisionService.find_duplicate_decisions(decision_text)
+    decision = await DecisionService.add_decision(decision_text, user, topic=topic)
     response_text = ResponseFormatter.format_decision_added(decision)
+    if duplicates:
+        response_text += ResponseFormatter.format_duplicate_warning(duplicates)
     return create_success_response(user_message, response_text)
 
 async def handle_list_command(user_message: A2AMessage, message_text: str) -> TaskResult:
-    decisions = await DecisionService.get_all_decisions(limit=20)
-    response_text = ResponseFormatter.format_decision_list(decisions)
-    return create_success_response(user_message, response_text)
+    _, cursor = CommandParser.extract_page_cursor(message_text)
+    try:
+        page = await DecisionService.get_all_decisions(limit=20, after=cursor)
+    except ValueError:
+        return create_error_response(user_message, "Invalid page cursor.")
+    response_text = ResponseFormatter.format_decision_list(page.decisions)
+    next_page = None
+    if page.next_cursor:
+        next_page = {"cursor": page.next_cursor, "command": f"/decision list --after {page.next_cursor}"}
+        response_text += ResponseFormatter.format_next_page(next_page["command"])
+    return create_success_response(user_message, response_text, next_page=next_page)
 
 async def handle_search_command(user_message: A2AMessage, message_text: str) -> TaskResult:
-    query = CommandParser.parse_search_query(message_text)
-    if not query:
+    message_text, cursor = CommandParser.extract_page_cursor(message_text)
+    arguments = CommandParser.parse_search_query(message_text)
+    try:
+        query, filters = CommandParser.extract_search_filters(arguments)
+    except ValueError:
+        return create_error_response(user_message, "Dates must be in YYYY-MM-DD format.")
+    if not query and not filters.is_active():
         return create_error_response(user_message, "Please provide a search query.")
-    decisions = await DecisionService.search_decisions(query)
-    response_text = ResponseFormatter.format_search_results(decisions, query)
+    try:
+        page = await DecisionService.search_decisions(query, after=cursor, filters=filters)
+    except ValueError:
+        return create_error_response(user_message, "Invalid page cursor.")
+    response_text = ResponseFormatter.format_search_results(page.decisions, query, fuzzy=page.fuzzy, filters=filters)
+    if page.facets:
+        response_text += ResponseFormatter.format_search_facets(page.facets)
+    next_page = None
+    if page.next_cursor:
+        next_page = {"cursor": page.next_cursor, "command": f"/decision search {arguments} --after {page.next_cursor}"}
+        response_text += ResponseFormatter.format_next_page(next_page["command"])
+    return create_success_response(user_message, response_text, next_page=next_page)
+
+async def handle_similar_command(user_message: A2AMessage, message_text: str) -> TaskResult:
+    text = CommandParser.extract_decision_text(message_text)
+    if not text:
+        return create_error_response(user_message, "Please provide text to compare against.")
+    matches = await DecisionService.find_similar_decisions(text)
+    response_text = ResponseFormatter.format_similar_results(matches, text)
     return create_success_response(user_message, response_text)
 
 async def handle_edit_command(user_message: A2AMessage, message_text: str) -> TaskResult:
@@ -93,23 +136,38 @@ async def handle_edit_command(user_message: A2AMessage, message_text: str) -> Ta
     return create_success_response(user_message, response_text)
 
 async def handle_history_command(user_message: A2AMessage, message_text: str) -> TaskResult:
+    message_text, cursor = CommandParser.extract_page_cursor(message_text)
+    message_text, diff = CommandParser.extract_flag(message_text, "diff")
     _, argument = CommandParser.parse_command(message_text)
     try:
         decision_id = int(argument)
     except (ValueError, TypeError):
         return create_error_response(user_message, "Invalid decision ID.")
-    history = await DecisionService.get_decision_history(decision_id)
-    # This needs a proper formatter in a real implementation
-    response_text = f"History for decision #{decision_id}:\\n" + "\\n".join([f"- {h.text}" for h in history])
-    return create_success_response(user_message, response_text)
+    try:
+        page = await DecisionService.get_decision_history(decision_id, after=cursor, diff=diff)
+    except ValueError:
+        return create_error_response(user_message, "Invalid page cursor.")
+    response_text = ResponseFormatter.format_decision_history(page.history, decision_id, diff=diff)
+    next_page = None
+    if page.next_cursor:
+        diff_option = " --diff" if diff else ""
+        next_page = {"cursor": page.next_cursor, "command": f"/decision history {decision_id}{diff_option} --after {page.next_cursor}"}
+        response_text += ResponseFormatter.format_next_page(next_page["command"])
+    return create_success_response(user_message, response_text, next_page=next_page)
 
 async def handle_propose_command(user_message: A2AMessage, message_text: str) -> TaskResult:
     decision_text = CommandParser.extract_decision_text(message_text)
     if not decision_text:
         return create_error_response(user_message, "Please provide proposal text.")
+    validation = await validate_decision(decision_text)
+    if not validation.is_valid:
+        return create_error_response(user_message, ResponseFormatter.format_invalid_decision(validation.reason))
     user = (user_message.metadata or {}).get("user", "unknown")
+    duplicates = await DecisionService.find_duplicate_decisions(decision_text)
     proposal = await VotingService.create_proposal(decision_text, user)
     response_text = ResponseFormatter.format_proposal_created(proposal)
+    if duplicates:
+        response_text += ResponseFormatter.format_duplicate_warning(duplicates)
     return create_success_response(user_message, response_text)
 
 async def handle_approve_command(user_message: A2AMessage, message_text: str) -> TaskResult:
@@ -151,6 +209,7 @@ COMMAND_HANDLERS = {
     "add": handle_add_command,
     "list": handle_list_command,
     "search": handle_search_command,
+    "similar": handle_similar_command,
     "edit": handle_edit_command,
     "history": handle_history_command,
     "propose": handle_propose_command,
@@ -160,7 +219,7 @@ COMMAND_HANDLERS = {
 }
 
 # Helper functions to create responses
-def create_success_response(user_message: A2AMessage, response_text: str, execution_results: dict = None, tool_results: dict = None) -> TaskResult:
+def create_success_response(user_message: A2AMessage, response_text: str, execution_results: dict = None, tool_results: dict = None, next_page: dict = None) -> TaskResult:
     # Create the agent's response message, populating taskId and metadata from the user's message
     response_message = A2AMessage(
         role="agent",
@@ -190,6 +249,13 @@ def create_success_response(user_message: A2AMessage, response_text: str, execut
             parts=[MessagePart(kind="data", data=tool_results, text=None, file_url=None)]
         ))
 
+    if next_page:
+        # Machine-readable token for fetching the next page of results
+        artifacts.append(Artifact(
+            name="NextPage",
+            parts=[MessagePart(kind="data", data=[next_page], text=None, file_url=None)]
+        ))
+
     # Ensure user_message in history also has taskId and metadata if available
     user_message_for_history = user_message.model_copy(update={
         "taskId": user_message.taskId,
@@ -1,12 +1,30 @@
 """
 Core decision management service
 """
-from app.database import execute_query, execute_insert
-from app.models import Decision, DecisionHistory
-from typing import List, Optional
-from datetime import datetime, timedelta
+from app.cache import cached
+from app.database import execute_query, read_snapshot, submit_write, transaction
+from app.models import Decision, DecisionPage, DecisionHistoryPage, SearchFilters
+from app.records import DecisionRecord, DecisionHistoryRecord, decisions_from_rows
+from app.config import get_settings
+from services.similarity_service import SimilarityService, embed_text, vector_to_blob
+from services.duplicate_service import DuplicateService
+from services.trigram_service import TrigramService
+from utils.parsers import CommandParser
+from utils.pagination import PageCursor
+from utils.diffs import apply_delta, make_delta, render_delta
+from utils import clock
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
 import json
 
+settings = get_settings()
+
+# Columns mapped onto Decision; leaves out the embedding BLOB
+DECISION_COLUMNS = (
+    "id, text, original_text, user, last_edited_by, last_edited_at, "
+    "created_at, edit_count, topic, metadata"
+)
+
 
 class DecisionService:
     """
@@ -18,196 +36,582 @@ class DecisionService:
         """
         Add a new decision to the database
         """
+        vector = embed_text(text)
+        
+        async def insert(db):
+            return await DecisionService.insert_decision(db, text, user, topic, vector)
+        
+        decision = await submit_write(insert)
+        DecisionService.index_decision(decision, vector)
+        
+        return decision
+    
+    @staticmethod
+    async def insert_decision(
+        db,
+        text: str,
+        user: str,
+        topic: Optional[str],
+        vector,
+        proposal_id: Optional[int] = None
+    ) -> Optional[Decision]:
+        """
+        Insert a decision on a connection that is inside a write
+        
+        Call index_decision once the write has committed. When promoting a
+        proposal, returns None if that proposal already has a decision.
+        """
         query = """
-        INSERT INTO decisions (text, original_text, user, topic)
-        VALUES (?, ?, ?, ?)
+        INSERT INTO decisions
+        (text, original_text, user, topic, embedding, created_at, day_key, proposal_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (proposal_id) DO NOTHING
+        RETURNING id
         """
         
-        decision_id = await execute_insert(query, (text, text, user, topic))
+        created = clock.now()
+        created_at = clock.to_epoch(created)
+        
+        cursor = await db.execute(
+            query,
+            (text, text, user, topic, vector_to_blob(vector), created_at, clock.day_key(created), proposal_id)
+        )
+        row = await cursor.fetchone()
+        if row is None:
+            return None
+        
+        await TrigramService.index_terms(db, text)
         
         return Decision(
-            id=decision_id,
+            id=row['id'],
             text=text,
             original_text=text,
             user=user,
             topic=topic,
-            timestamp=datetime.now()
+            timestamp=clock.from_epoch(created_at)
         )
     
     @staticmethod
+    def index_decision(decision: Decision, vector):
+        """
+        Add a committed decision to the in-memory similarity and duplicate indexes
+        """
+        SimilarityService.index_decision(decision.id, vector)
+        DuplicateService.index_decision(decision.id, decision.text)
+    
+    @staticmethod
+    @cached
     async def get_decision_by_id(decision_id: int) -> Optional[Decision]:
         """
         Get a decision by ID
         """
-        query = "SELECT * FROM decisions WHERE id = ?"
+        query = f"SELECT {DECISION_COLUMNS} FROM decisions WHERE id = ?"
         result = await execute_query(query, (decision_id,), fetch_one=True)
         
         if not result:
             return None
         
-        return Decision(
-            id=result['id'],
-            text=result['text'],
-            original_text=result['original_text'],
-            user=result['user'],
-            last_edited_by=result['last_edited_by'],
-            last_edited_at=datetime.fromisoformat(result['last_edited_at']) if result['last_edited_at'] else None,
-            timestamp=datetime.fromisoformat(result['timestamp']),
-            edit_count=result['edit_count'],
-            topic=result['topic']
-        )
+        return DecisionRecord.model_from_row(result)
     
     @staticmethod
-    async def get_all_decisions(limit: int = 50) -> List[Decision]:
+    @cached
+    async def get_all_decisions(limit: int = 50, after: Optional[str] = None) -> DecisionPage:
         """
-        Get all decisions (most recent first)
+        Get a page of decisions (most recent first)
+        
+        Args:
+            limit: Maximum number of decisions on the page
+            after: Cursor from a previous page's next_cursor
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
-        query = "SELECT * FROM decisions ORDER BY timestamp DESC LIMIT ?"
-        results = await execute_query(query, (limit,))
+        if after:
+            created_at, last_id = PageCursor.decode(after, 2)
+            query = f"""
+            SELECT {DECISION_COLUMNS} FROM decisions
+            WHERE (created_at, id) < (?, ?)
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+            """
+            params = (created_at, last_id, limit + 1)
+        else:
+            query = f"SELECT {DECISION_COLUMNS} FROM decisions ORDER BY created_at DESC, id DESC LIMIT ?"
+            params = (limit + 1,)
         
-        return [
-            Decision(
-                id=row['id'],
-                text=row['text'],
-                original_text=row['original_text'],
-                user=row['user'],
-                last_edited_by=row['last_edited_by'],
-                last_edited_at=datetime.fromisoformat(row['last_edited_at']) if row['last_edited_at'] else None,
-                timestamp=datetime.fromisoformat(row['timestamp']),
-                edit_count=row['edit_count'],
-                topic=row['topic']
-            )
-            for row in results
-        ]
+        results = await execute_query(query, params)
+        
+        # One extra row tells us whether another page exists
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = PageCursor.encode(results[-1]['created_at'], results[-1]['id'])
+        
+        decisions = decisions_from_rows(results)
+        
+        return DecisionPage(decisions=decisions, next_cursor=next_cursor)
+    
+    @staticmethod
+    @cached
+    async def search_decisions(
+        query: str,
+        limit: int = 20,
+        after: Optional[str] = None,
+        filters: Optional[SearchFilters] = None
+    ) -> DecisionPage:
+        """
+        Search decisions by keyword, optionally narrowed by user, topic and date
+        
+        Uses the FTS5 index over text and topic, best BM25 match first.
+        Supports phrases ("use postgres") and prefixes (deploy*). Pages are
+        keyed on (rank, id) so the ranking order is preserved across pages.
+        With filters and no keyword, decisions are listed newest first from
+        the composite (user|topic, created_at, id) indexes instead.
+        
+        When the exact search finds fewer than FUZZY_SEARCH_MIN_RESULTS hits,
+        a typo-tolerant tier re-runs it with each word widened to close
+        spellings from the trigram index. The cursor records which tier a
+        page came from so later pages stay in the same tier.
+        
+        The first page also carries facet counts per user and per topic over
+        the whole filtered result set.
+        
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        filters = filters or SearchFilters()
+        
+        key = None
+        fuzzy = False
+        if after:
+            first, last_id, tier = PageCursor.decode(after, 3)
+            key, fuzzy = (first, last_id), bool(tier)
+        
+        if not query:
+            if not filters.is_active():
+                return DecisionPage(decisions=[])
+            page = await DecisionService._run_filtered_listing(filters, limit, key)
+            if not after:
+                page.facets = await DecisionService._search_facets(None, filters)
+            return page
+        
+        if fuzzy:
+            match_query = await TrigramService.build_fuzzy_query(query, settings.fuzzy_search_threshold)
+        else:
+            match_query = CommandParser.to_fts_query(query)
+        if not match_query:
+            return DecisionPage(decisions=[])
+        
+        page = await DecisionService._run_search(match_query, limit, key, fuzzy, filters)
+        
+        # Fallback tier: only for a first page that came back (nearly) empty
+        if not after and len(page.decisions) < settings.fuzzy_search_min_results:
+            fuzzy_query = await TrigramService.build_fuzzy_query(query, settings.fuzzy_search_threshold)
+            if fuzzy_query and fuzzy_query != match_query:
+                fuzzy_page = await DecisionService._run_search(fuzzy_query, limit, None, True, filters)
+                if len(fuzzy_page.decisions) > len(page.decisions):
+                    page, match_query = fuzzy_page, fuzzy_query
+        
+        if not after:
+            page.facets = await DecisionService._search_facets(match_query, filters)
+        
+        return page
+    
+    @staticmethod
+    def _filter_clause(filters: SearchFilters) -> Tuple[str, tuple]:
+        """
+        Build the SQL conditions (on alias d) for the search filters
+        """
+        conditions = []
+        params = ()
+        
+        if filters.user:
+            conditions.append("d.user = ?")
+            params += (filters.user,)
+        if filters.topic:
+            conditions.append("d.topic = ?")
+            params += (filters.topic,)
+        # Days are calendar days in the team's timezone; `until` is inclusive
+        if filters.since:
+            conditions.append("d.created_at >= ?")
+            params += (clock.day_bounds(filters.since)[0],)
+        if filters.until:
+            conditions.append("d.created_at < ?")
+            params += (clock.day_bounds(filters.until)[1],)
+        
+        return "".join(f" AND {condition}" for condition in conditions), params
+    
+    @staticmethod
+    async def _run_search(
+        match_query: str,
+        limit: int,
+        key: Optional[tuple],
+        fuzzy: bool,
+        filters: SearchFilters
+    ) -> DecisionPage:
+        """
+        Run one page of an FTS5 MATCH query, starting after the (rank, id) key
+        """
+        filter_sql, params = DecisionService._filter_clause(filters)
+        params = (match_query,) + params
+        
+        keyset_filter = ""
+        if key:
+            rank, last_id = key
+            keyset_filter = "AND (decisions_fts.rank > ? OR (decisions_fts.rank = ? AND d.id < ?))"
+            params += (rank, rank, last_id)
+        
+        sql_query = f"""
+        SELECT d.id, d.text, d.original_text, d.user, d.last_edited_by, d.last_edited_at,
+               d.created_at, d.edit_count, d.topic, d.metadata,
+               decisions_fts.rank AS search_rank
+        FROM decisions_fts
+        JOIN decisions d ON d.id = decisions_fts.rowid
+        WHERE decisions_fts MATCH ?{filter_sql} {keyset_filter}
+        ORDER BY decisions_fts.rank, d.id DESC
+        LIMIT ?
+        """
+        results = await execute_query(sql_query, params + (limit + 1,))
+        
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = PageCursor.encode(results[-1]['search_rank'], results[-1]['id'], int(fuzzy))
+        
+        decisions = decisions_from_rows(results)
+        
+        return DecisionPage(decisions=decisions, next_cursor=next_cursor, fuzzy=fuzzy)
+    
+    @staticmethod
+    async def _run_filtered_listing(filters: SearchFilters, limit: int, key: Optional[tuple]) -> DecisionPage:
+        """
+        List filtered decisions newest first, starting after the (created_at, id) key
+        
+        The equality filters lead the composite indexes, so this is a range
+        scan on (user, created_at, id) or (topic, created_at, id).
+        """
+        filter_sql, params = DecisionService._filter_clause(filters)
+        
+        keyset_filter = ""
+        if key:
+            keyset_filter = "AND (d.created_at, d.id) < (?, ?)"
+            params += tuple(key)
+        
+        query = f"""
+        SELECT {DECISION_COLUMNS} FROM decisions d
+        WHERE 1 = 1{filter_sql} {keyset_filter}
+        ORDER BY d.created_at DESC, d.id DESC
+        LIMIT ?
+        """
+        results = await execute_query(query, params + (limit + 1,))
+        
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = PageCursor.encode(results[-1]['created_at'], results[-1]['id'], 0)
+        
+        decisions = decisions_from_rows(results)
+        
+        return DecisionPage(decisions=decisions, next_cursor=next_cursor)
     
     @staticmethod
-    async def search_decisions(query: str) -> List[Decision]:
+    async def _search_facets(match_query: Optional[str], filters: SearchFilters) -> Dict[str, Dict[str, int]]:
         """
-        Search decisions by keyword
+        Count matching decisions per user and per topic (top 10 of each)
         """
-        sql_query = """
-        SELECT * FROM decisions 
-        WHERE text LIKE ? OR topic LIKE ?
-        ORDER BY timestamp DESC
+        filter_sql, params = DecisionService._filter_clause(filters)
+        
+        if match_query:
+            source = "decisions_fts JOIN decisions d ON d.id = decisions_fts.rowid"
+            where = f"decisions_fts MATCH ?{filter_sql}"
+            params = (match_query,) + params
+        else:
+            source = "decisions d"
+            where = f"1 = 1{filter_sql}"
+        
+        facets = {}
+        for column in ("user", "topic"):
+            query = f"""
+            SELECT d.{column} AS value, COUNT(*) AS count
+            FROM {source}
+            WHERE {where} AND d.{column} IS NOT NULL
+            GROUP BY d.{column}
+            ORDER BY count DESC, value
+            LIMIT 10
+            """
+            results = await execute_query(query, params)
+            facets[column] = {row['value']: row['count'] for row in results}
+        
+        return facets
+    
+    @staticmethod
+    async def find_similar_decisions(text: str, k: Optional[int] = None) -> List[Tuple[Decision, float]]:
+        """
+        Find decisions semantically similar to the given text
+        
+        Scores every decision against the in-memory embedding matrix in one
+        vectorized pass, then loads only the top-k rows.
+        
+        Returns:
+            (decision, similarity score) pairs, most similar first
         """
-        search_pattern = f"%{query}%"
-        results = await execute_query(sql_query, (search_pattern, search_pattern))
+        matches = await SimilarityService.find_similar(
+            text,
+            k or settings.similarity_top_k,
+            settings.similarity_min_score
+        )
+        if not matches:
+            return []
+        
+        decisions = await DecisionService.get_decisions_by_ids([decision_id for decision_id, _ in matches])
         
         return [
-            Decision(
-                id=row['id'],
-                text=row['text'],
-                original_text=row['original_text'],
-                user=row['user'],
-                last_edited_by=row['last_edited_by'],
-                last_edited_at=datetime.fromisoformat(row['last_edited_at']) if row['last_edited_at'] else None,
-                timestamp=datetime.fromisoformat(row['timestamp']),
-                edit_count=row['edit_count'],
-                topic=row['topic']
-            )
-            for row in results
+            (decisions[decision_id].to_model(), score)
+            for decision_id, score in matches
+            if decision_id in decisions
         ]
     
     @staticmethod
-    async def update_decision(decision_id: int, new_text: str, editor: str) -> Optional[Decision]:
+    async def find_duplicate_decisions(text: str, limit: int = 3) -> List[Tuple[Decision, float]]:
         """
-        Update an existing decision
+        Find existing decisions that are near-duplicates of the given text
+        
+        Uses the in-memory MinHash LSH index, so only decisions sharing a
+        band bucket with the text are compared and only matches are loaded.
+        
+        Returns:
+            (decision, estimated Jaccard similarity) pairs, closest first
         """
-        # First, get the current decision
-        decision = await DecisionService.get_decision_by_id(decision_id)
+        matches = await DuplicateService.find_duplicates(text, settings.duplicate_similarity_threshold)
+        matches = matches[:limit]
+        if not matches:
+            return []
         
-        if not decision:
-            return None
+        decisions = await DecisionService.get_decisions_by_ids([decision_id for decision_id, _ in matches])
         
-        # Save to history
-        history_query = """
-        INSERT INTO decision_history (decision_id, text, edited_by)
-        VALUES (?, ?, ?)
+        return [
+            (decisions[decision_id].to_model(), score)
+            for decision_id, score in matches
+            if decision_id in decisions
+        ]
+    
+    @staticmethod
+    async def get_decisions_by_ids(decision_ids: List[int]) -> Dict[int, DecisionRecord]:
         """
-        await execute_insert(history_query, (decision_id, decision.text, editor))
+        Load a set of decisions by primary key, keyed by ID
         
-        # Update the decision
-        update_query = """
-        UPDATE decisions 
-        SET text = ?, 
-            last_edited_by = ?, 
-            last_edited_at = ?,
-            edit_count = edit_count + 1
-        WHERE id = ?
+        Returns internal records; callers convert the ones they hand out.
         """
+        placeholders = ", ".join("?" for _ in decision_ids)
+        query = f"SELECT {DECISION_COLUMNS} FROM decisions WHERE id IN ({placeholders})"
+        results = await execute_query(query, tuple(decision_ids))
         
-        now = datetime.now()
-        await execute_query(update_query, (new_text, editor, now.isoformat(), decision_id))
+        return {
+            row['id']: DecisionRecord.from_row(row)
+            for row in results
+        }
+    
+    @staticmethod
+    async def update_decision(decision_id: int, new_text: str, editor: str) -> Optional[Decision]:
+        """
+        Update an existing decision
+        """
+        now = clock.now()
+        vector = embed_text(new_text)
+
+        # Read, snapshot and update on one connection in one transaction
+        async with transaction() as db:
+            cursor = await db.execute(
+                f"SELECT {DECISION_COLUMNS} FROM decisions WHERE id = ?", (decision_id,)
+            )
+            row = await cursor.fetchone()
+
+            if not row:
+                return None
+
+            # Save the replaced text to history, encoded against the new text
+            history_query = """
+            INSERT INTO decision_history (decision_id, text, delta, is_keyframe, edited_by)
+            VALUES (?, ?, ?, ?, ?)
+            """
+            entry = DecisionService.encode_history_entry(row['text'], new_text, row['edit_count'] + 1)
+            await db.execute(history_query, (decision_id, *entry, editor))
+
+            # Update the decision
+            update_query = """
+            UPDATE decisions 
+            SET text = ?, 
+                last_edited_by = ?, 
+                last_edited_at = ?,
+                edit_count = edit_count + 1,
+                embedding = ?
+            WHERE id = ?
+            """
+            await db.execute(
+                update_query,
+                (new_text, editor, now.isoformat(), vector_to_blob(vector), decision_id)
+            )
+            await TrigramService.index_terms(db, new_text)
         
+        SimilarityService.index_decision(decision_id, vector)
+        DuplicateService.index_decision(decision_id, new_text)
+
         # Return updated decision
+        decision = DecisionRecord.from_row(row)
         decision.text = new_text
         decision.last_edited_by = editor
         decision.last_edited_at = now
         decision.edit_count += 1
+        return decision.to_model()
+    
+    @staticmethod
+    def encode_history_entry(text: str, next_text: str, edit_number: int) -> Tuple[str, Optional[str], int]:
+        """
+        Choose how to store the text a decision had before its Nth edit
         
-        return decision
+        Every HISTORY_KEYFRAME_INTERVAL-th edit is a keyframe holding the
+        full text; the others hold a delta against the next version. A
+        delta that would not be smaller than the text is stored in full.
+        
+        Returns:
+            (text, delta, is_keyframe) column values
+        """
+        if edit_number % settings.history_keyframe_interval != 0:
+            delta = make_delta(text, next_text)
+            if len(delta) < len(text):
+                return ("", delta, 0)
+        return (text, None, 1)
     
     @staticmethod
-    async def get_decision_history(decision_id: int) -> List[DecisionHistory]:
+    async def _version_after(db, decision_id: int, edited_at: str, history_id: int) -> str:
         """
-        Get edit history for a decision
+        Rebuild the version of a decision that followed a history row
+        
+        Starts from the closest newer keyframe, or the current text when
+        there is none, and applies deltas back down to the row.
         """
-        query = """
+        newer = []
+        last_key = (edited_at, history_id)
+        base = None
+        
+        while base is None:
+            cursor = await db.execute(
+                """
+                SELECT id, edited_at, text, delta, is_keyframe FROM decision_history
+                WHERE decision_id = ? AND (edited_at, id) > (?, ?)
+                ORDER BY edited_at, id
+                LIMIT ?
+                """,
+                (decision_id, *last_key, settings.history_keyframe_interval)
+            )
+            rows = await cursor.fetchall()
+            
+            for row in rows:
+                if row['is_keyframe']:
+                    base = row['text']
+                    break
+                newer.append(row['delta'])
+            
+            if base is None and len(rows) < settings.history_keyframe_interval:
+                cursor = await db.execute("SELECT text FROM decisions WHERE id = ?", (decision_id,))
+                base = (await cursor.fetchone())['text']
+            elif rows:
+                last_key = (rows[-1]['edited_at'], rows[-1]['id'])
+        
+        for delta in reversed(newer):
+            base = apply_delta(base, delta)
+        
+        return base
+    
+    @staticmethod
+    async def get_decision_history(
+        decision_id: int,
+        limit: int = 20,
+        after: Optional[str] = None,
+        diff: bool = False
+    ) -> DecisionHistoryPage:
+        """
+        Get a page of edit history for a decision (most recent first)
+        
+        Versions stored as deltas are rebuilt on the fly, walking back from
+        the nearest newer keyframe. With diff=True each entry also carries
+        an inline diff to the version that replaced it.
+        
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        keyset_filter = ""
+        params = (decision_id,)
+        if after:
+            edited_at, last_id = PageCursor.decode(after, 2)
+            keyset_filter = "AND (edited_at, id) < (?, ?)"
+            params += (edited_at, last_id)
+        
+        query = f"""
         SELECT * FROM decision_history 
-        WHERE decision_id = ? 
-        ORDER BY edited_at DESC
+        WHERE decision_id = ? {keyset_filter}
+        ORDER BY edited_at DESC, id DESC
+        LIMIT ?
         """
-        results = await execute_query(query, (decision_id,))
         
-        return [
-            DecisionHistory(
-                id=row['id'],
-                decision_id=row['decision_id'],
-                text=row['text'],
-                edited_by=row['edited_by'],
-                edited_at=datetime.fromisoformat(row['edited_at'])
-            )
-            for row in results
-        ]
+        # One snapshot, so the page and the rows it is rebuilt from agree
+        async with read_snapshot() as db:
+            cursor = await db.execute(query, params + (limit + 1,))
+            results = await cursor.fetchall()
+            
+            next_cursor = None
+            if len(results) > limit:
+                results = results[:limit]
+                next_cursor = PageCursor.encode(results[-1]['edited_at'], results[-1]['id'])
+            
+            base = None
+            if results and (diff or not results[0]['is_keyframe']):
+                base = await DecisionService._version_after(
+                    db, decision_id, results[0]['edited_at'], results[0]['id']
+                )
+        
+        history = []
+        for row in results:
+            record = DecisionHistoryRecord.from_row(row)
+            if not row['is_keyframe']:
+                record.text = apply_delta(base, row['delta'])
+            if diff:
+                delta = row['delta'] or make_delta(record.text, base)
+                record.diff = render_delta(base, delta)
+            history.append(record.to_model())
+            base = record.text
+        
+        return DecisionHistoryPage(history=history, next_cursor=next_cursor)
     
     @staticmethod
-    async def get_decisions_by_date_range(start_date: datetime, end_date: datetime) -> List[Decision]:
+    async def get_decisions_by_date_range(start_date: datetime, end_date: datetime) -> List[DecisionRecord]:
         """
-        Get decisions within a date range
+        Get decisions within a date range (inclusive; naive datetimes are team-local)
         """
-        query = """
-        SELECT * FROM decisions 
-        WHERE timestamp BETWEEN ? AND ?
-        ORDER BY timestamp DESC
+        query = f"""
+        SELECT {DECISION_COLUMNS} FROM decisions 
+        WHERE created_at BETWEEN ? AND ?
+        ORDER BY created_at DESC, id DESC
         """
         
         results = await execute_query(
             query, 
-            (start_date.isoformat(), end_date.isoformat())
+            (clock.to_epoch(start_date), clock.to_epoch(end_date))
         )
         
-        return [
-            Decision(
-                id=row['id'],
-                text=row['text'],
-                original_text=row['original_text'],
-                user=row['user'],
-                last_edited_by=row['last_edited_by'],
-                last_edited_at=datetime.fromisoformat(row['last_edited_at']) if row['last_edited_at'] else None,
-                timestamp=datetime.fromisoformat(row['timestamp']),
-                edit_count=row['edit_count'],
-                topic=row['topic']
-            )
-            for row in results
-        ]
+        return [DecisionRecord.from_row(row) for row in results]
     
     @staticmethod
-    async def get_todays_decisions() -> List[Decision]:
+    async def get_todays_decisions() -> List[DecisionRecord]:
         """
-        Get all decisions made today
+        Get all decisions made today (in the team's timezone)
         """
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
+        query = f"""
+        SELECT {DECISION_COLUMNS} FROM decisions 
+        WHERE day_key = ?
+        ORDER BY created_at DESC, id DESC
+        """
+        
+        results = await execute_query(query, (clock.day_key(clock.now()),))
         
-        return await DecisionService.get_decisions_by_date_range(today_start, today_end)
-    
\ No newline at end of file
+        return [DecisionRecord.from_row(row) for row in results]
@@ -0,0 +1,227 @@
+"""
+Near-duplicate decision detection with MinHash locality-sensitive hashing
+"""
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from app.database import execute_query
+
+# Signature length and LSH banding: 16 bands of 4 rows puts the
+# candidate threshold at roughly (1/16) ** (1/4) ≈ 0.5 Jaccard similarity
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# Character shingle size over the normalized text
+SHINGLE_SIZE = 4
+
+# Prime just above 2**32 for the universal hash family (a * x + b) mod p.
+# a, b and x are all below 2**32, so a * x + b never overflows uint64.
+HASH_PRIME = np.uint64(4294967311)
+
+_rng = np.random.RandomState(20251030)  # Fixed seed: signatures are stable across restarts
+_PERM_A = _rng.randint(1, 2 ** 32 - 1, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.randint(0, 2 ** 32 - 1, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+NON_WORD_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def _shingles(text: str) -> np.ndarray:
+    """
+    Hash the character shingles of the normalized text
+    """
+    normalized = NON_WORD_PATTERN.sub(" ", text.lower()).strip()
+    if len(normalized) < SHINGLE_SIZE:
+        normalized = normalized.ljust(SHINGLE_SIZE)
+
+    shingles = {
+        normalized[i:i + SHINGLE_SIZE]
+        for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    }
+    return np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """
+    Compute the MinHash signature of a decision's text
+    """
+    shingles = _shingles(text)
+    hashes = (_PERM_A[:, None] * shingles[None, :] + _PERM_B[:, None]) % HASH_PRIME
+    return hashes.min(axis=1)
+
+
+class MinHashLSHIndex:
+    """
+    In-memory MinHash signatures bucketed by LSH band.
+
+    Looking up a text hashes its signature bands and only compares against
+    decisions that share at least one band bucket, so a lookup never
+    touches the rest of the corpus.
+    """
+
+    def __init__(self):
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, Set[int]]] = [defaultdict(set) for _ in range(LSH_BANDS)]
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @staticmethod
+    def _band_keys(signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()
+            for band in range(LSH_BANDS)
+        ]
+
+    def remove(self, decision_id: int):
+        """
+        Drop a decision from the index
+        """
+        signature = self._signatures.pop(decision_id, None)
+        if signature is None:
+            return
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(decision_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def add(self, decision_id: int, signature: np.ndarray):
+        """
+        Add a decision, replacing any previous signature for it
+        """
+        self.remove(decision_id)
+        self._signatures[decision_id] = signature
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band][key].add(decision_id)
+
+    def candidates(self, signature: np.ndarray) -> Set[int]:
+        """
+        Decisions sharing at least one band bucket with the signature
+        """
+        found = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            found |= self._buckets[band].get(key, set())
+        return found
+
+    def query(self, signature: np.ndarray, threshold: float) -> List[Tuple[int, float]]:
+        """
+        Return (decision_id, estimated Jaccard similarity) pairs above the threshold
+        """
+        matches = []
+        for decision_id in self.candidates(signature):
+            similarity = float(np.mean(self._signatures[decision_id] == signature))
+            if similarity >= threshold:
+                matches.append((decision_id, similarity))
+
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def clusters(self, threshold: float) -> List[List[int]]:
+        """
+        Group the whole corpus into clusters of near-duplicates
+
+        Candidate pairs come from shared band buckets and are verified
+        against the threshold before being merged with union-find.
+        """
+        parent: Dict[int, int] = {}
+
+        def find(x: int) -> int:
+            root = x
+            while parent.get(root, root) != root:
+                root = parent[root]
+            if root != x:
+                parent[x] = root
+            return root
+
+        for band_buckets in self._buckets:
+            for bucket in band_buckets.values():
+                if len(bucket) < 2:
+                    continue
+                members = sorted(bucket)
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        if find(first) == find(second):
+                            continue
+                        similarity = np.mean(self._signatures[first] == self._signatures[second])
+                        if similarity >= threshold:
+                            parent[find(second)] = find(first)
+
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for decision_id in parent:
+            groups[find(decision_id)].append(decision_id)
+
+        return sorted(
+            (sorted(set(members) | {root}) for root, members in groups.items()),
+            key=len,
+            reverse=True
+        )
+
+
+_index = MinHashLSHIndex()
+
+
+class DuplicateService:
+    """
+    Service for detecting near-duplicate decisions
+    """
+
+    @staticmethod
+    async def load_index() -> MinHashLSHIndex:
+        """
+        Build the LSH index from every stored decision (called at startup)
+        """
+        results = await execute_query("SELECT id, text FROM decisions")
+
+        index = MinHashLSHIndex()
+        for row in results:
+            index.add(row['id'], minhash_signature(row['text']))
+        index.loaded = True
+
+        global _index
+        _index = index
+        print(f"✅ Duplicate index loaded ({len(index)} decisions)")
+        return index
+
+    @staticmethod
+    async def get_index() -> MinHashLSHIndex:
+        """
+        Get the LSH index, building it on first use outside the app lifespan
+        """
+        if not _index.loaded:
+            return await DuplicateService.load_index()
+        return _index
+
+    @staticmethod
+    def index_decision(decision_id: int, text: str):
+        """
+        Incrementally add or refresh a decision after it is committed
+        """
+        if _index.loaded:
+            _index.add(decision_id, minhash_signature(text))
+
+    @staticmethod
+    async def find_duplicates(text: str, threshold: float) -> List[Tuple[int, float]]:
+        """
+        Find existing decisions that are near-duplicates of the text
+        """
+        index = await DuplicateService.get_index()
+        return index.query(minhash_signature(text), threshold)
+
+    @staticmethod
+    async def find_clusters(threshold: float) -> List[List[int]]:
+        """
+        Find every cluster of near-duplicate decisions in the corpus
+        """
+        index = await DuplicateService.get_index()
+        return index.clusters(threshold)
@@ -0,0 +1,192 @@
+"""
+Background expiry of pending proposals
+"""
+import asyncio
+import heapq
+import math
+import time
+from typing import List, Optional, Set, Tuple
+from uuid import uuid4
+
+from app.config import get_settings
+from app.database import execute_query, submit_write
+from app.models import A2AMessage, MessagePart, TaskResult, TaskStatus
+from app.records import ProposalRecord, parse_timestamp
+from services.notification_service import send_webhook_notification
+from utils import clock
+from utils.formatters import ResponseFormatter
+
+settings = get_settings()
+
+
+class ProposalExpirySweeper:
+    """
+    Min-heap of pending expirations drained by a single background task.
+
+    The task sleeps until the earliest deadline, rounded up to the next
+    tick, then expires everything that is due with one UPDATE. Proposals
+    whose deadlines fall in the same tick share that UPDATE. Entries for
+    proposals that were approved or rejected in the meantime are skipped
+    by the UPDATE itself (it only touches pending rows), so nothing has
+    to be removed from the heap when voting finishes.
+    """
+
+    def __init__(self, tick: float):
+        self.tick = tick
+        self._heap: List[Tuple[float, int]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # Webhook notifications in flight; sent off the sweep loop so a slow
+        # webhook never delays the next tick
+        self._notifications: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, proposal_id: int, expires_at: float):
+        """
+        Add a pending proposal's deadline (epoch seconds)
+        """
+        deadline = math.ceil(expires_at / self.tick) * self.tick
+        if not self._heap or deadline < self._heap[0][0]:
+            self._wakeup.set()
+        heapq.heappush(self._heap, (deadline, proposal_id))
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Let notices for already-expired proposals go out
+        await asyncio.gather(*self._notifications, return_exceptions=True)
+
+    def _pop_due(self, now: float) -> List[int]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+        return due
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - time.time() if self._heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due = self._pop_due(time.time())
+            try:
+                expired = await ExpiryService.expire_proposals(due)
+            except Exception as e:
+                print(f"⚠️ Proposal expiry sweep failed: {e}")
+                # Try again on the next tick rather than dropping the deadlines
+                for proposal_id in due:
+                    self.schedule(proposal_id, time.time() + self.tick)
+                continue
+            if expired:
+                print(f"⏰ Expired {len(expired)} proposal(s)")
+                task = asyncio.create_task(ExpiryService.notify_expired(expired))
+                self._notifications.add(task)
+                task.add_done_callback(self._notification_done)
+
+    def _notification_done(self, task: asyncio.Task):
+        self._notifications.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"⚠️ Proposal expiry notification failed: {task.exception()}")
+
+
+_sweeper: Optional[ProposalExpirySweeper] = None
+
+
+class ExpiryService:
+    """
+    Service that owns the pending → expired transition of proposals
+    """
+
+    @staticmethod
+    async def start():
+        """
+        Load every pending deadline and start the sweeper (called at startup)
+        """
+        global _sweeper
+        if _sweeper is not None:
+            return
+
+        _sweeper = ProposalExpirySweeper(settings.expiry_sweep_tick_seconds)
+
+        results = await execute_query(
+            "SELECT id, expires_at FROM proposed_decisions WHERE status = 'pending' AND expires_at IS NOT NULL"
+        )
+        for row in results:
+            ExpiryService.schedule(row['id'], clock.to_epoch(parse_timestamp(row['expires_at'])))
+
+        _sweeper.start()
+        print(f"✅ Proposal expiry sweeper started ({len(_sweeper)} pending)")
+
+    @staticmethod
+    async def stop():
+        global _sweeper
+        if _sweeper is not None:
+            await _sweeper.stop()
+            _sweeper = None
+
+    @staticmethod
+    def schedule(proposal_id: int, expires_at: int):
+        """
+        Track a new pending proposal (no-op when the sweeper is not running)
+        """
+        if _sweeper is not None:
+            _sweeper.schedule(proposal_id, expires_at)
+
+    @staticmethod
+    async def expire_proposals(proposal_ids: List[int]) -> List[ProposalRecord]:
+        """
+        Mark the given proposals expired in one statement
+
+        Only rows still pending change; those are returned.
+        """
+        if not proposal_ids:
+            return []
+
+        placeholders = ", ".join("?" for _ in proposal_ids)
+        query = f"""
+        UPDATE proposed_decisions SET status = 'expired'
+        WHERE status = 'pending' AND id IN ({placeholders})
+        RETURNING *
+        """
+
+        async def expire(db):
+            cursor = await db.execute(query, tuple(proposal_ids))
+            return await cursor.fetchall()
+
+        rows = await submit_write(expire)
+        return [ProposalRecord.from_row(row) for row in rows]
+
+    @staticmethod
+    async def notify_expired(proposals: List[ProposalRecord]):
+        """
+        Post an expiry notice to PROPOSAL_EXPIRY_WEBHOOK_URL, if configured
+        """
+        if not settings.proposal_expiry_webhook_url:
+            return
+
+        message = A2AMessage(
+            role="agent",
+            parts=[MessagePart(kind="text", text=ResponseFormatter.format_proposals_expired(proposals))]
+        )
+        task_result = TaskResult(
+            id=str(uuid4()),
+            contextId="proposal-expiry",
+            status=TaskStatus(state="completed", message=message)
+        )
+        await send_webhook_notification(settings.proposal_expiry_webhook_url, task_result)
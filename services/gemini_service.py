@@ -1,30 +1,67 @@
 """
-Gemini AI integration for validation and summarization
+LLM-backed validation and summarization (Gemini by default)
 """
-import google.generativeai as genai
+import asyncio
+import hashlib
 import json
 from app.config import get_settings
-from app.models import ValidationResult, Decision
-from typing import List
+from app.models import ValidationResult
+from app.records import DecisionRecord
+from services.llm_client import CircuitOpenError
+from services.llm_providers import get_provider
+from services.model_router import ModelRouter, routes_from_settings
+from services.validation_cache_service import ValidationCacheService
+from utils.validators import KEYWORD_PATTERN, alpha_ratio, score_decision_text
+from typing import Dict, List, Optional, Tuple
 
 settings = get_settings()
 
-# Configure Gemini
-genai.configure(api_key=settings.gemini_api_key)
-model = genai.GenerativeModel('gemini-2.5-pro')
+_router: Optional[ModelRouter] = None
 
 
-async def validate_decision(text: str) -> ValidationResult:
+def get_router() -> ModelRouter:
     """
-    Validate if text is a meaningful decision using Gemini
+    Model router over the configured provider (LLM_PROVIDER), created on
+    first use so importing this module never touches the provider
+    """
+    global _router
+    if _router is None:
+        _router = ModelRouter(routes_from_settings(), get_provider().sender)
+    return _router
+
+
+async def generate_text(task: str, prompt: str, timeout: float) -> str:
+    """
+    Run one LLM request for a task ("validation" or "summary")
     
-    Args:
-        text: The decision text to validate
-        
-    Returns:
-        ValidationResult with is_valid flag and reason
+    The task's model and generation config come from Settings (see
+    ModelRouter); the request goes to the configured provider through the
+    resilient client (see LLMClient): bounded concurrency, the circuit
+    breaker and the current command's deadline. The timeout covers both
+    waiting for a slot and the request itself.
+    
+    Raises:
+        CircuitOpenError: If the model is currently considered degraded
+        asyncio.TimeoutError: If no response arrives within the timeout
     """
-    prompt = f"""
+    return await get_router().generate(task, prompt, timeout)
+
+
+def get_llm_status() -> dict:
+    """
+    Describe the provider, model routing and the LLM clients for the health endpoint
+    """
+    if _router is None:
+        return {"provider": settings.llm_provider, "started": False}
+    
+    return {
+        "provider": settings.llm_provider,
+        "provider_stats": get_provider().stats(),
+        **_router.stats()
+    }
+
+
+VALIDATION_PROMPT = """
 Analyze if this is a valid team decision statement:
 "{text}"
 
@@ -44,27 +81,255 @@ Examples:
 - "ok" → {{"is_valid": false, "reason": "Too vague and short"}}
 """
 
-    try:
-        response = model.generate_content(prompt)
-        result_text = response.text.strip()
+BATCH_VALIDATION_PROMPT = """
+Analyze if each of these is a valid team decision statement.
+The statements, as a JSON array:
+{texts}
+
+A valid decision should:
+- Be a clear, actionable statement
+- Make sense in a team/work context
+- Not be gibberish, random characters, or nonsensical
+- Be at least 3 words long
+- Contain meaningful content
+
+Respond ONLY with a valid JSON array of exactly {count} objects, one per
+statement and in the same order, each in this exact format:
+{{"is_valid": true, "reason": "Brief explanation of why it's valid or invalid"}}
+
+Example for ["Use PostgreSQL for database", "asdfkjh"]:
+[{{"is_valid": true, "reason": "Clear technical decision"}}, {{"is_valid": false, "reason": "Random characters with no meaning"}}]
+"""
+
+# Cached validations from a different prompt or model are ignored
+VALIDATION_PROMPT_VERSION = hashlib.sha256(
+    "|".join([
+        settings.validation_model,
+        settings.validation_fallback_model or "",
+        VALIDATION_PROMPT,
+        BATCH_VALIDATION_PROMPT
+    ]).encode("utf-8")
+).hexdigest()[:12]
+
+
+def _extract_json(result_text: str):
+    """
+    Parse JSON from a model response, unwrapping markdown code blocks
+    """
+    if "```json" in result_text:
+        result_text = result_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in result_text:
+        result_text = result_text.split("```")[1].split("```")[0].strip()
+    
+    return json.loads(result_text)
+
+
+def _to_validation_result(result_dict) -> ValidationResult:
+    return ValidationResult(
+        is_valid=result_dict.get("is_valid", False),
+        reason=result_dict.get("reason", "Unknown")
+    )
+
+
+async def _ask_validation(text: str) -> ValidationResult:
+    """
+    Validate one text with its own Gemini request
+    """
+    result_text = await generate_text("validation", VALIDATION_PROMPT.format(text=text), settings.llm_validation_timeout_seconds)
+    return _to_validation_result(_extract_json(result_text))
+
+
+async def _ask_batch_validation(texts: List[str]) -> List[ValidationResult]:
+    """
+    Validate several texts with one Gemini request
+    
+    Raises:
+        ValueError: If the response is not one result per text
+    """
+    prompt = BATCH_VALIDATION_PROMPT.format(
+        texts=json.dumps(texts, ensure_ascii=False),
+        count=len(texts)
+    )
+    result_text = await generate_text("validation", prompt, settings.llm_validation_timeout_seconds)
+    
+    results = _extract_json(result_text)
+    if not isinstance(results, list) or len(results) != len(texts):
+        raise ValueError(f"expected a JSON array of {len(texts)} results")
+    if not all(isinstance(result, dict) for result in results):
+        raise ValueError("expected an object per result")
+    
+    return [_to_validation_result(result) for result in results]
+
+
+class ValidationBatcher:
+    """
+    Coalesces concurrent validation requests into one Gemini request
+    
+    The first request opens a window of VALIDATION_BATCH_WINDOW_MS; every
+    request arriving in it joins the batch, which is sent early once it
+    holds VALIDATION_BATCH_MAX_SIZE texts. Results are handed back to each
+    waiting caller. If the batch response can't be parsed, each text is
+    retried with its own request; if the batch timed out or the circuit
+    breaker is open, every caller gets that error (retrying a slow model
+    would only double the wait).
+    """
+    
+    def __init__(self):
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        self.batches = 0
+        self.batched_texts = 0
+        self.batch_failures = 0
+    
+    async def validate(self, text: str) -> ValidationResult:
+        """
+        Queue a text for the current batch and wait for its result
         
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0].strip()
+        Raises whatever the Gemini request raised for this text.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
         
-        result_dict = json.loads(result_text)
+        if len(self._pending) >= settings.validation_batch_max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(settings.validation_batch_window_ms / 1000, self._flush)
         
-        return ValidationResult(
-            is_valid=result_dict.get("is_valid", False),
-            reason=result_dict.get("reason", "Unknown")
-        )
+        return await future
+    
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]):
+        # Identical texts in one window are asked about once
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        
+        if len(texts) == 1:
+            outcomes = await asyncio.gather(_ask_validation(texts[0]), return_exceptions=True)
+        else:
+            self.batches += 1
+            self.batched_texts += len(texts)
+            try:
+                outcomes = await _ask_batch_validation(texts)
+            except (asyncio.TimeoutError, CircuitOpenError) as e:
+                outcomes = [e] * len(texts)
+            except Exception as e:
+                self.batch_failures += 1
+                print(f"⚠️ Batch validation failed ({e}); validating {len(texts)} texts individually")
+                outcomes = await asyncio.gather(
+                    *[_ask_validation(text) for text in texts],
+                    return_exceptions=True
+                )
+        
+        by_text = dict(zip(texts, outcomes))
+        for text, future in batch:
+            if future.done():
+                continue
+            outcome = by_text[text]
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+    
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "batched_texts": self.batched_texts,
+            "batch_failures": self.batch_failures,
+            "window_ms": settings.validation_batch_window_ms,
+            "max_size": settings.validation_batch_max_size
+        }
+
+
+_validation_batcher = ValidationBatcher()
+
+
+# How validations were settled, for the health endpoint
+_validation_counts = {"local_accepted": 0, "local_rejected": 0, "escalated": 0}
+
+
+async def validate_decision(text: str) -> ValidationResult:
+    """
+    Validate if text is a meaningful decision
+    
+    Clear cases are settled locally by score_decision_text: at or above
+    VALIDATION_ACCEPT_SCORE the text is accepted, at or below
+    VALIDATION_REJECT_SCORE it is rejected. Only the band in between is
+    sent to Gemini.
+    
+    Args:
+        text: The decision text to validate
+        
+    Returns:
+        ValidationResult with is_valid flag and reason
+    """
+    score, reason = score_decision_text(text)
+    
+    if score >= settings.validation_accept_score:
+        _validation_counts["local_accepted"] += 1
+        return ValidationResult(is_valid=True, reason=reason)
+    if score <= settings.validation_reject_score:
+        _validation_counts["local_rejected"] += 1
+        return ValidationResult(is_valid=False, reason=reason)
     
+    _validation_counts["escalated"] += 1
+    return await validate_with_llm(text)
+
+
+def get_validation_status() -> dict:
+    """
+    Describe how validations were settled, for the health endpoint
+    """
+    total = sum(_validation_counts.values())
+    return {
+        **_validation_counts,
+        "accept_score": settings.validation_accept_score,
+        "reject_score": settings.validation_reject_score,
+        "escalation_rate": round(_validation_counts["escalated"] / total, 3) if total else None,
+        "batching": _validation_batcher.stats()
+    }
+
+
+async def validate_with_llm(text: str) -> ValidationResult:
+    """
+    Validate if text is a meaningful decision using Gemini
+    
+    Answers are cached by normalized text (see ValidationCacheService), and
+    concurrent cache misses share Gemini requests (see ValidationBatcher).
+    
+    Args:
+        text: The decision text to validate
+        
+    Returns:
+        ValidationResult with is_valid flag and reason
+    """
+    cached_result = await ValidationCacheService.get(text, VALIDATION_PROMPT_VERSION)
+    if cached_result is not None:
+        return cached_result
+    
+    try:
+        result = await _validation_batcher.validate(text)
     except Exception as e:
-        # Fallback validation if Gemini fails
-        print(f"⚠️ Gemini validation error: {e}")
+        # Fallback validation if Gemini fails (not cached)
+        print(f"⚠️ LLM validation error: {e}")
         return fallback_validation(text)
+    
+    try:
+        ValidationCacheService.put(text, VALIDATION_PROMPT_VERSION, result)
+    except Exception as e:
+        print(f"⚠️ Validation cache write failed: {e}")
+    
+    return result
 
 
 def fallback_validation(text: str) -> ValidationResult:
@@ -81,24 +346,14 @@ def fallback_validation(text: str) -> ValidationResult:
         )
     
     # Check for mostly alphabetic characters
-    letters = sum(c.isalpha() or c.isspace() for c in text)
-    if letters / max(len(text), 1) < 0.6:
+    if alpha_ratio(text) < 0.6:
         return ValidationResult(
             is_valid=False,
             reason="Text contains too many non-alphabetic characters"
         )
     
-    # Check for common decision keywords
-    decision_keywords = [
-        "use", "adopt", "switch", "choose", "decide", "implement",
-        "deploy", "move", "change", "upgrade", "select", "go with",
-        "will", "should", "agreed", "approve"
-    ]
-    
-    text_lower = text.lower()
-    has_keyword = any(keyword in text_lower for keyword in decision_keywords)
-    
-    if has_keyword:
+    # Check for common decision keywords (whole words, as in the local scorer)
+    if KEYWORD_PATTERN.search(text):
         return ValidationResult(
             is_valid=True,
             reason="Contains decision-related keywords"
@@ -111,12 +366,156 @@ def fallback_validation(text: str) -> ValidationResult:
     )
 
 
-async def generate_daily_summary(decisions: List[Decision], date: str) -> str:
+CHUNK_SUMMARY_PROMPT = """
+You are a team assistant for DecisionNote, helping summarize a busy day in parts.
+
+These {count} decisions ({label}) are one part of today's decisions:
+{decisions_text}
+
+Write 2-3 sentences capturing the key themes and strategic implications of
+this part. Do NOT list the decisions one by one. Plain text only.
+"""
+
+REDUCE_SUMMARY_PROMPT = """
+You are a team assistant for DecisionNote. Create a concise, insightful daily summary.
+
+Today's date: {date}
+Number of decisions: {count}
+
+Today's decisions were summarized in parts, by topic or author:
+{partials}
+
+Combine these into one natural, engaging 2-3 sentence summary that:
+1. Highlights key themes or patterns across all parts
+2. Notes any strategic implications
+3. Sounds encouraging and team-friendly
+4. Does NOT just list the decisions (they'll be shown separately)
+
+Keep it professional but warm. Focus on insights, not repetition.
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for prompt sizing (~4 characters per token)
+    """
+    return len(text) // 4
+
+
+def format_decision_lines(decisions: List[DecisionRecord]) -> str:
+    return "\n".join([
+        f"{i+1}. \"{d.text}\" (by {d.user}, {d.timestamp.strftime('%I:%M %p')})"
+        for i, d in enumerate(decisions)
+    ])
+
+
+def chunk_decisions(decisions: List[DecisionRecord]) -> List[Tuple[str, List[DecisionRecord]]]:
+    """
+    Split a day's decisions into labelled chunks for map-reduce summarization
+    
+    Decisions are grouped by topic, or by author when they have none.
+    Groups larger than SUMMARY_CHUNK_MAX_DECISIONS are split, then the
+    pieces are packed into chunks of up to that size (largest first, each
+    into the first chunk with room), so the number of LLM calls stays
+    close to the minimum.
+    
+    Example (max 3):
+        infra ×4, frontend ×1, by ada ×1
+        → "infra" (3 decisions), "infra, frontend, by ada" (3 decisions)
+    """
+    max_size = max(settings.summary_chunk_max_decisions, 1)
+    
+    groups: Dict[str, List[DecisionRecord]] = {}
+    for decision in decisions:
+        label = decision.topic or f"by {decision.user}"
+        groups.setdefault(label, []).append(decision)
+    
+    pieces = [
+        (label, group[start:start + max_size])
+        for label, group in groups.items()
+        for start in range(0, len(group), max_size)
+    ]
+    pieces.sort(key=lambda piece: -len(piece[1]))
+    
+    chunks: List[Tuple[List[str], List[DecisionRecord]]] = []
+    for label, piece in pieces:
+        for labels, chunk in chunks:
+            if len(chunk) + len(piece) <= max_size:
+                break
+        else:
+            labels, chunk = [], []
+            chunks.append((labels, chunk))
+        if label not in labels:
+            labels.append(label)
+        chunk.extend(piece)
+    
+    return [(", ".join(labels), chunk) for labels, chunk in chunks]
+
+
+def use_map_reduce(decisions: List[DecisionRecord], decisions_text: str) -> bool:
+    """
+    Whether a day is too big for a single summary prompt
+    """
+    return (
+        len(decisions) > settings.summary_map_reduce_min_decisions
+        or estimate_tokens(decisions_text) > settings.summary_map_reduce_min_tokens
+    )
+
+
+async def summarize_in_chunks(decisions: List[DecisionRecord], date: str) -> str:
+    """
+    Map-reduce summary: summarize chunks concurrently, then combine them
+    
+    At most SUMMARY_MAP_CONCURRENCY chunk prompts run at once. A chunk
+    whose summary fails is represented by a one-line count, and if the
+    final combining call fails the partial summaries are returned as-is.
+    
+    Raises:
+        RuntimeError: If every chunk summary failed
+    """
+    chunks = chunk_decisions(decisions)
+    slots = asyncio.Semaphore(max(settings.summary_map_concurrency, 1))
+    
+    async def summarize_chunk(label: str, chunk: List[DecisionRecord]) -> Optional[str]:
+        prompt = CHUNK_SUMMARY_PROMPT.format(
+            count=len(chunk),
+            label=label,
+            decisions_text=format_decision_lines(chunk)
+        )
+        async with slots:
+            try:
+                return await generate_text("summary", prompt, settings.llm_summary_timeout_seconds)
+            except Exception as e:
+                print(f"⚠️ LLM chunk summary error ({label}): {e}")
+                return None
+    
+    results = await asyncio.gather(*[summarize_chunk(label, chunk) for label, chunk in chunks])
+    if not any(results):
+        raise RuntimeError(f"all {len(chunks)} chunk summaries failed")
+    
+    partials = "\n".join(
+        f"- {label}: {summary}" if summary else f"- {label}: {len(chunk)} decisions (no summary available)"
+        for (label, chunk), summary in zip(chunks, results)
+    )
+    print(f"🧩 Summarized {len(decisions)} decisions in {len(chunks)} chunks")
+    
+    prompt = REDUCE_SUMMARY_PROMPT.format(date=date, count=len(decisions), partials=partials)
+    try:
+        return await generate_text("summary", prompt, settings.llm_summary_timeout_seconds)
+    except Exception as e:
+        print(f"⚠️ LLM summary reduce error: {e}")
+        return partials
+
+
+async def generate_daily_summary(decisions: List[DecisionRecord], date: str) -> str:
     """
     Generate AI-powered daily summary of decisions
     
+    Busy days (see use_map_reduce) are summarized in chunks first and
+    then combined, instead of in one oversized prompt.
+    
     Args:
-        decisions: List of Decision objects from today
+        decisions: Today's decision records
         date: Date string for the summary
         
     Returns:
@@ -126,10 +525,7 @@ async def generate_daily_summary(decisions: List[Decision], date: str) -> str:
         return f"📊 Daily Decision Summary - {date}\n\nNo decisions were recorded today. Keep the momentum going! 💪"
     
     # Format decisions for prompt
-    decisions_text = "\n".join([
-        f"{i+1}. \"{d.text}\" (by {d.user}, {d.timestamp.strftime('%I:%M %p')})"
-        for i, d in enumerate(decisions)
-    ])
+    decisions_text = format_decision_lines(decisions)
     
     prompt = f"""
 You are a team assistant for DecisionNote. Create a concise, insightful daily summary.
@@ -150,8 +546,10 @@ Keep it professional but warm. Focus on insights, not repetition.
 """
 
     try:
-        response = model.generate_content(prompt)
-        ai_summary = response.text.strip()
+        if use_map_reduce(decisions, decisions_text):
+            ai_summary = await summarize_in_chunks(decisions, date)
+        else:
+            ai_summary = await generate_text("summary", prompt, settings.llm_summary_timeout_seconds)
         
         # Format final summary
         formatted_summary = f"""📊 Daily Decision Summary - {date}
@@ -165,7 +563,7 @@ Today's Decisions ({len(decisions)}):
         return formatted_summary
     
     except Exception as e:
-        print(f"⚠️ Gemini summary error: {e}")
+        print(f"⚠️ LLM summary error: {e}")
         # Fallback to basic summary
         return f"""📊 Daily Decision Summary - {date}
 
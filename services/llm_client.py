@@ -0,0 +1,304 @@
+"""
+Resilient client for LLM requests: circuit breaker, deadlines and hedging
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, List, Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# monotonic() time by which the current command's LLM calls must finish
+_command_deadline: ContextVar[Optional[float]] = ContextVar("llm_command_deadline", default=None)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling the LLM while the circuit breaker is open
+    """
+
+
+@contextmanager
+def command_deadline(seconds: float):
+    """
+    Share one LLM time budget among every call made inside the block
+
+    Each call's timeout is cut to whatever is left of the budget, so a
+    command never waits on the LLM longer than `seconds` in total.
+
+    Usage:
+        with command_deadline(settings.llm_command_deadline_seconds):
+            return await handler(user_message, message_text)
+    """
+    token = _command_deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _command_deadline.reset(token)
+
+
+def remaining_budget() -> Optional[float]:
+    """
+    Seconds left in the current command's LLM budget (None if unbounded)
+    """
+    deadline = _command_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def percentile(samples, fraction: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+class CircuitBreaker:
+    """
+    Trips open when too many recent LLM calls failed or were slow.
+
+    Closed: calls go through and their outcomes fill a rolling window.
+    Once the window holds LLM_BREAKER_MIN_CALLS outcomes and the share of
+    failures (errors, timeouts, calls slower than
+    LLM_BREAKER_SLOW_CALL_SECONDS) reaches LLM_BREAKER_FAILURE_RATE, it
+    opens. Open: calls fail immediately for LLM_BREAKER_COOLDOWN_SECONDS.
+    Half-open: a single probe call is let through; success closes the
+    breaker, failure opens it again.
+    """
+
+    def __init__(self):
+        self.state = "closed"
+        self._outcomes = deque(maxlen=settings.llm_breaker_window)  # True = failure
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+        self.rejected_calls = 0
+
+    def is_open(self) -> bool:
+        """
+        Whether calls are being rejected outright (open and still cooling down)
+        """
+        return (
+            self.state == "open"
+            and time.monotonic() - self._opened_at < settings.llm_breaker_cooldown_seconds
+        )
+
+    def allows_call(self) -> bool:
+        """
+        Whether before_call would let a call through right now
+        """
+        if self.is_open():
+            return False
+        return self.state == "closed" or not self._probe_in_flight
+
+    def before_call(self):
+        """
+        Raise CircuitOpenError if a call may not go through now
+        """
+        if self.is_open():
+            self.rejected_calls += 1
+            raise CircuitOpenError("LLM circuit breaker is open")
+        if self.state == "open":
+            self.state = "half_open"
+
+        if self.state == "half_open":
+            if self._probe_in_flight:
+                self.rejected_calls += 1
+                raise CircuitOpenError("LLM circuit breaker is half-open; probe in flight")
+            self._probe_in_flight = True
+
+    def record(self, failed: bool):
+        """
+        Record the outcome of a call that before_call let through
+        """
+        if self.state == "half_open":
+            self._probe_in_flight = False
+            if failed:
+                self._open()
+            else:
+                self.state = "closed"
+                self._outcomes.clear()
+            return
+
+        if self.state == "open":
+            # Started before the breaker opened; outcome no longer matters
+            return
+
+        self._outcomes.append(failed)
+        if (
+            len(self._outcomes) >= settings.llm_breaker_min_calls
+            and self.failure_rate() >= settings.llm_breaker_failure_rate
+        ):
+            self._open()
+
+    def cancel_call(self):
+        """
+        Forget a call that was cancelled before it had an outcome
+        """
+        self._probe_in_flight = False
+
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def _open(self):
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        self._outcomes.clear()
+        print(f"⚠️ LLM circuit breaker opened for {settings.llm_breaker_cooldown_seconds:g}s")
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate(), 3),
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected_calls
+        }
+
+
+class LLMClient:
+    """
+    Wraps a raw `(prompt, options) → text` coroutine with the protections every LLM
+    call needs: bounded concurrency, per-call timeouts cut to the command
+    deadline, the circuit breaker, and optional hedging.
+
+    With LLM_HEDGE_REQUESTS on, a call that has not answered by the p95
+    of recent latencies gets a second, identical request; whichever
+    answers first wins and the other is cancelled.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, Optional[dict]], Awaitable[str]],
+        slots: Optional[asyncio.Semaphore] = None
+    ):
+        self._send = send
+        self._slots = slots or asyncio.Semaphore(settings.llm_max_concurrency)
+        self.breaker = CircuitBreaker()
+        self._latencies = deque(maxlen=settings.llm_latency_window)  # (finished_at, seconds)
+        self.calls = 0
+        self.failures = 0
+        self.deadline_exceeded = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    async def generate(self, prompt: str, timeout: float, options: Optional[dict] = None) -> str:
+        """
+        Run one LLM request
+
+        The timeout covers waiting for a concurrency slot and the request.
+        `options` (e.g. a generation config) are passed through to `send`.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            asyncio.TimeoutError: If no answer arrives in time
+        """
+        remaining = remaining_budget()
+        if remaining is not None:
+            if remaining <= 0:
+                self.deadline_exceeded += 1
+                raise asyncio.TimeoutError("command deadline exceeded")
+            timeout = min(timeout, remaining)
+
+        self.breaker.before_call()
+        self.calls += 1
+        start = time.monotonic()
+
+        try:
+            text = await asyncio.wait_for(self._hedged(prompt, options), timeout)
+        except asyncio.TimeoutError:
+            self.failures += 1
+            self.breaker.record(failed=True)
+            raise asyncio.TimeoutError(f"no response within {timeout:.3g}s")
+        except asyncio.CancelledError:
+            self.breaker.cancel_call()
+            raise
+        except Exception:
+            self.failures += 1
+            self.breaker.record(failed=True)
+            raise
+
+        slow = time.monotonic() - start >= settings.llm_breaker_slow_call_seconds
+        self.breaker.record(failed=slow)
+        return text
+
+    async def _attempt(self, prompt: str, options: Optional[dict]) -> str:
+        async with self._slots:
+            start = time.monotonic()
+            text = await self._send(prompt, options)
+            finished = time.monotonic()
+            self._latencies.append((finished, finished - start))
+            return text
+
+    def recent_latencies(self) -> List[float]:
+        """
+        Latencies of successful requests from the last LLM_LATENCY_MAX_AGE_SECONDS
+        """
+        oldest = time.monotonic() - settings.llm_latency_max_age_seconds
+        return [seconds for finished, seconds in self._latencies if finished >= oldest]
+
+    def latency_p95(self) -> Optional[float]:
+        return percentile(self.recent_latencies(), 0.95)
+
+    def _hedge_delay(self) -> Optional[float]:
+        if not settings.llm_hedge_requests:
+            return None
+        latencies = self.recent_latencies()
+        if len(latencies) < settings.llm_hedge_min_samples:
+            return None
+        return percentile(latencies, 0.95)
+
+    async def _hedged(self, prompt: str, options: Optional[dict]) -> str:
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._attempt(prompt, options)
+
+        first = asyncio.ensure_future(self._attempt(prompt, options))
+        hedge = None
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                self.hedges += 1
+                hedge = asyncio.ensure_future(self._attempt(prompt, options))
+                pending.add(hedge)
+
+            error = None
+            while done or pending:
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        latencies = self.recent_latencies()
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "deadline_exceeded": self.deadline_exceeded,
+            "latency_p50_seconds": _round(percentile(latencies, 0.5)),
+            "latency_p95_seconds": _round(percentile(latencies, 0.95)),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "breaker": self.breaker.stats()
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
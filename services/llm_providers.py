@@ -0,0 +1,168 @@
+"""
+LLM providers: where prompts are actually sent
+"""
+import asyncio
+import json
+import random
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional
+
+from app.config import get_settings
+from utils.validators import score_decision_text
+
+settings = get_settings()
+
+# Raw request function for one model: (prompt, generation config) → text
+Sender = Callable[[str, Optional[dict]], Awaitable[str]]
+
+
+class LLMProvider(ABC):
+    """
+    Base for LLM backends
+
+    A provider only turns a model name into a raw request function;
+    timeouts, retries, breakers and routing are handled above it by
+    ModelRouter and LLMClient, identically for every provider.
+    """
+    name = "base"
+
+    @abstractmethod
+    def sender(self, model: str) -> Sender:
+        """
+        The raw request function for a model
+        """
+
+    def stats(self) -> dict:
+        return {}
+
+
+class GeminiProvider(LLMProvider):
+    """
+    Google Gemini through the google-generativeai SDK's async API
+    """
+    name = "gemini"
+
+    def __init__(self, api_key: str):
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY is required when LLM_PROVIDER=gemini")
+
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self._genai = genai
+
+    def sender(self, model: str) -> Sender:
+        generative_model = self._genai.GenerativeModel(model)
+
+        async def send(prompt: str, generation_config: Optional[dict]) -> str:
+            response = await generative_model.generate_content_async(prompt, generation_config=generation_config)
+            return response.text.strip()
+
+        return send
+
+
+class StubProviderError(Exception):
+    """
+    Failure injected by the stub provider
+    """
+
+
+class StubProvider(LLMProvider):
+    """
+    Offline provider for load tests and local development
+
+    Answers without the network after a simulated latency drawn from
+    LLM_STUB_LATENCY_DISTRIBUTION ("fixed", "uniform" or "lognormal")
+    around LLM_STUB_LATENCY_MS, optionally per model through
+    LLM_STUB_MODEL_LATENCY_MS. A share LLM_STUB_FAILURE_RATE of requests
+    raise StubProviderError and a share LLM_STUB_HANG_RATE never answer
+    (until the caller's timeout). Draws come from a generator seeded with
+    LLM_STUB_SEED, so a sequential run is reproducible.
+
+    Answers follow the prompt: validation prompts get JSON verdicts based
+    on the local decision score, batch prompts a JSON array of them, and
+    anything else a fixed summary sentence.
+    """
+    name = "stub"
+
+    # Recognizes the prompts in gemini_service
+    SINGLE_VALIDATION_PATTERN = re.compile(r'valid team decision statement:\n"(.*?)"\n\n', re.DOTALL)
+    BATCH_VALIDATION_PATTERN = re.compile(r"The statements, as a JSON array:\n(.*?)\n\n", re.DOTALL)
+
+    def __init__(self):
+        self._random = random.Random(settings.llm_stub_seed)
+        self.requests = 0
+        self.injected_failures = 0
+        self.injected_hangs = 0
+
+    def latency(self, model: str) -> float:
+        """
+        Draw one simulated latency in seconds
+        """
+        center = settings.llm_stub_model_latency_ms.get(model, settings.llm_stub_latency_ms) / 1000
+        spread = settings.llm_stub_latency_spread
+        distribution = settings.llm_stub_latency_distribution
+
+        if distribution == "uniform":
+            return max(0.0, self._random.uniform(center * (1 - spread), center * (1 + spread)))
+        if distribution == "lognormal":
+            # Median `center`, long right tail like real LLM latencies
+            return self._random.lognormvariate(0.0, spread) * center
+        return center
+
+    def sender(self, model: str) -> Sender:
+        async def send(prompt: str, generation_config: Optional[dict]) -> str:
+            self.requests += 1
+            roll = self._random.random()
+            await asyncio.sleep(self.latency(model))
+
+            if roll < settings.llm_stub_failure_rate:
+                self.injected_failures += 1
+                raise StubProviderError(f"injected failure from stub model {model}")
+            if roll < settings.llm_stub_failure_rate + settings.llm_stub_hang_rate:
+                self.injected_hangs += 1
+                await asyncio.Event().wait()
+
+            return self.answer(prompt)
+
+        return send
+
+    def answer(self, prompt: str) -> str:
+        """
+        Deterministic response for a prompt
+        """
+        batch = self.BATCH_VALIDATION_PATTERN.search(prompt)
+        if batch:
+            texts = json.loads(batch.group(1))
+            return json.dumps([self._verdict(text) for text in texts])
+
+        single = self.SINGLE_VALIDATION_PATTERN.search(prompt)
+        if single:
+            return json.dumps(self._verdict(single.group(1)))
+
+        return "The team made steady progress today, with decisions that keep delivery moving."
+
+    @staticmethod
+    def _verdict(text: str) -> dict:
+        score, reason = score_decision_text(text)
+        return {"is_valid": score >= 0.5, "reason": f"Stub verdict: {reason}"}
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "injected_failures": self.injected_failures,
+            "injected_hangs": self.injected_hangs
+        }
+
+
+@lru_cache()
+def get_provider() -> LLMProvider:
+    """
+    The provider selected by LLM_PROVIDER, created on first use
+    """
+    if settings.llm_provider == "stub":
+        print("🧪 Using the offline stub LLM provider")
+        return StubProvider()
+    return GeminiProvider(settings.gemini_api_key)
@@ -0,0 +1,116 @@
+"""
+Per-task model routing for LLM calls
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.config import get_settings
+from services.llm_client import LLMClient, remaining_budget
+
+settings = get_settings()
+
+# Builds the raw `(prompt, options) → text` call for a model name
+SendFactory = Callable[[str], Callable[[str, Optional[dict]], Awaitable[str]]]
+
+
+class ModelRoute:
+    """
+    Which model serves a task, with what generation settings
+    """
+
+    def __init__(
+        self,
+        model: str,
+        max_output_tokens: int,
+        temperature: float,
+        fallback_model: Optional[str] = None
+    ):
+        self.model = model
+        self.fallback_model = fallback_model
+        self.generation_config = {
+            "max_output_tokens": max_output_tokens,
+            "temperature": temperature
+        }
+
+
+def routes_from_settings() -> Dict[str, ModelRoute]:
+    """
+    The task → model table configured in Settings
+    """
+    return {
+        "validation": ModelRoute(
+            settings.validation_model,
+            settings.validation_max_output_tokens,
+            settings.validation_temperature,
+            settings.validation_fallback_model
+        ),
+        "summary": ModelRoute(
+            settings.summary_model,
+            settings.summary_max_output_tokens,
+            settings.summary_temperature,
+            settings.summary_fallback_model
+        )
+    }
+
+
+class ModelRouter:
+    """
+    Sends each task's prompts to its configured model.
+
+    Every model gets its own LLMClient (and so its own circuit breaker and
+    latency history); all of them share one concurrency limit. A task is
+    downgraded to its fallback model while the primary model's breaker
+    rejects calls, or when the primary's p95 latency would not fit in the
+    time left for the call (the task timeout, cut to the command deadline).
+    Once the breaker's cooldown ends, the half-open probe is routed to the
+    primary so it can close the breaker again.
+    """
+
+    def __init__(self, routes: Dict[str, ModelRoute], make_send: SendFactory):
+        self.routes = routes
+        self._make_send = make_send
+        self._slots = asyncio.Semaphore(settings.llm_max_concurrency)
+        self._clients: Dict[str, LLMClient] = {}
+        self.downgrades: Dict[str, int] = {task: 0 for task in routes}
+
+    def client(self, model: str) -> LLMClient:
+        if model not in self._clients:
+            self._clients[model] = LLMClient(self._make_send(model), slots=self._slots)
+        return self._clients[model]
+
+    def choose_model(self, task: str, timeout: float) -> str:
+        """
+        Pick the model for one call of a task
+        """
+        route = self.routes[task]
+        if not route.fallback_model:
+            return route.model
+
+        primary = self.client(route.model)
+        remaining = remaining_budget()
+        budget = min(timeout, remaining) if remaining is not None else timeout
+
+        p95 = primary.latency_p95()
+        if not primary.breaker.allows_call() or (p95 is not None and p95 >= budget):
+            self.downgrades[task] += 1
+            return route.fallback_model
+        return route.model
+
+    async def generate(self, task: str, prompt: str, timeout: float) -> str:
+        """
+        Run one prompt for a task on its routed model
+        """
+        model = self.choose_model(task, timeout)
+        return await self.client(model).generate(
+            prompt, timeout, options=self.routes[task].generation_config
+        )
+
+    def stats(self) -> dict:
+        return {
+            "routes": {
+                task: {"model": route.model, "fallback_model": route.fallback_model, **route.generation_config}
+                for task, route in self.routes.items()
+            },
+            "downgrades": dict(self.downgrades),
+            "models": {model: client.stats() for model, client in self._clients.items()}
+        }
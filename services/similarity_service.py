@@ -0,0 +1,211 @@
+"""
+Local vector similarity index for semantic decision search
+"""
+import asyncio
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.database import execute_query
+
+# Size of the hashed feature space (float32 → 1 KB per decision)
+EMBEDDING_DIMENSIONS = 256
+
+# Character n-gram sizes taken from each padded word
+NGRAM_SIZES = (3, 4)
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _features(text: str) -> Counter:
+    """
+    Extract word and character n-gram features from text
+    """
+    features = Counter()
+
+    for word in WORD_PATTERN.findall(text.lower()):
+        features[f"w:{word}"] += 1
+        padded = f" {word} "
+        for n in NGRAM_SIZES:
+            for i in range(len(padded) - n + 1):
+                features[padded[i:i + n]] += 1
+
+    return features
+
+
+def embed_text(text: str) -> np.ndarray:
+    """
+    Embed text as an L2-normalized hashed n-gram vector
+
+    Features are hashed into EMBEDDING_DIMENSIONS buckets with a stable
+    hash (crc32) and a hash-derived sign so collisions tend to cancel out
+    instead of piling up. Counts are dampened with 1 + log(tf). Fully
+    offline and deterministic across processes.
+    """
+    vector = np.zeros(EMBEDDING_DIMENSIONS, dtype=np.float32)
+
+    for feature, count in _features(text).items():
+        h = zlib.crc32(feature.encode("utf-8"))
+        sign = 1.0 if h & 0x80000000 else -1.0
+        vector[h % EMBEDDING_DIMENSIONS] += sign * (1.0 + math.log(count))
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+
+    return vector
+
+
+def vector_to_blob(vector: np.ndarray) -> bytes:
+    """
+    Serialize an embedding for the decisions.embedding column
+    """
+    return vector.astype(np.float32).tobytes()
+
+
+class SimilarityIndex:
+    """
+    In-memory matrix of decision embeddings scored with one vectorized pass.
+
+    Rows live in a preallocated float32 matrix that doubles when full, so
+    adding a decision is O(1) amortized and editing one overwrites its row
+    in place. Per-bucket document frequencies are kept alongside to weight
+    query buckets by IDF: buckets shared by most decisions count for less.
+    """
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS, capacity: int = 1024):
+        self.dimensions = dimensions
+        self._matrix = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._rows: Dict[int, int] = {}
+        self._document_frequency = np.zeros(dimensions, dtype=np.int64)
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _grow(self):
+        capacity = self._matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        matrix[:len(self)] = self._matrix[:len(self)]
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:len(self)] = self._ids[:len(self)]
+        self._matrix, self._ids = matrix, ids
+
+    def upsert(self, decision_id: int, vector: np.ndarray):
+        """
+        Add a decision's embedding, or replace it after an edit
+        """
+        row = self._rows.get(decision_id)
+
+        if row is None:
+            if len(self) == self._matrix.shape[0]:
+                self._grow()
+            row = len(self)
+            self._rows[decision_id] = row
+            self._ids[row] = decision_id
+        else:
+            self._document_frequency -= self._matrix[row] != 0
+
+        self._matrix[row] = vector
+        self._document_frequency += vector != 0
+
+    def load(self, ids: np.ndarray, matrix: np.ndarray):
+        """
+        Replace the whole index with a bulk-loaded matrix
+        """
+        capacity = max(len(ids), 1024)
+        self._matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        self._matrix[:len(ids)] = matrix
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._ids[:len(ids)] = ids
+        self._rows = {int(decision_id): row for row, decision_id in enumerate(ids)}
+        self._document_frequency = np.count_nonzero(matrix, axis=0).astype(np.int64)
+        self.loaded = True
+
+    def search(self, vector: np.ndarray, k: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Return up to k (decision_id, score) pairs, best match first
+        """
+        count = len(self)
+        if count == 0 or k <= 0:
+            return []
+
+        # Weight query buckets by smoothed IDF, then renormalize
+        idf = np.log((1 + count) / (1 + self._document_frequency)) + 1.0
+        query = vector * idf.astype(np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        query /= norm
+
+        scores = self._matrix[:count] @ query
+
+        k = min(k, count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            (int(self._ids[row]), float(scores[row]))
+            for row in top
+            if scores[row] >= min_score
+        ]
+
+
+_index = SimilarityIndex()
+
+
+class SimilarityService:
+    """
+    Service for maintaining and querying the decision similarity index
+    """
+
+    @staticmethod
+    async def load_index() -> SimilarityIndex:
+        """
+        Load every stored embedding into memory (called at startup)
+        """
+        results = await execute_query(
+            "SELECT id, embedding FROM decisions WHERE embedding IS NOT NULL ORDER BY id"
+        )
+
+        ids = np.fromiter((row['id'] for row in results), dtype=np.int64, count=len(results))
+        matrix = np.frombuffer(
+            b"".join(row['embedding'] for row in results), dtype=np.float32
+        ).reshape(len(results), EMBEDDING_DIMENSIONS)
+
+        _index.load(ids, matrix)
+        print(f"✅ Similarity index loaded ({len(_index)} decisions)")
+        return _index
+
+    @staticmethod
+    async def get_index() -> SimilarityIndex:
+        """
+        Get the similarity index, loading it on first use outside the app lifespan
+        """
+        if not _index.loaded:
+            await SimilarityService.load_index()
+        return _index
+
+    @staticmethod
+    def index_decision(decision_id: int, vector: np.ndarray):
+        """
+        Incrementally add or refresh a decision after it is committed
+        """
+        if _index.loaded:
+            _index.upsert(decision_id, vector)
+
+    @staticmethod
+    async def find_similar(text: str, k: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Find the decision IDs most similar to the given text
+
+        The scoring pass runs on a worker thread (NumPy releases the GIL), so
+        a scan over a large index does not stall the event loop.
+        """
+        index = await SimilarityService.get_index()
+        return await asyncio.to_thread(index.search, embed_text(text), k, min_score)
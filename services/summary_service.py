@@ -3,7 +3,7 @@ Daily summary generation service
 """
 from services.decision_service import DecisionService
 from services.gemini_service import generate_daily_summary
-from datetime import datetime
+from utils import clock
 
 
 class SummaryService:
@@ -23,7 +23,7 @@ class SummaryService:
         decisions = await DecisionService.get_todays_decisions()
         
         # Get today's date
-        today = datetime.now().strftime("%B %d, %Y")
+        today = clock.now().strftime("%B %d, %Y")
         
         # Generate AI summary
         summary_text = await generate_daily_summary(decisions, today)
@@ -0,0 +1,114 @@
+"""
+Trigram index over the search vocabulary for typo-tolerant search
+"""
+import re
+from typing import List, Set
+
+import aiosqlite
+
+from app.database import execute_query
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words shorter than this are matched exactly only
+MIN_FUZZY_WORD_LENGTH = 3
+
+# Closest vocabulary terms tried per misspelled word
+MAX_FUZZY_ALTERNATIVES = 5
+
+
+def extract_words(text: str) -> List[str]:
+    """
+    Lowercase alphanumeric words, in order
+    """
+    return WORD_PATTERN.findall(text.lower())
+
+
+def trigrams(word: str) -> Set[str]:
+    """
+    Padded character trigrams of a word ("cat" → "  c", " ca", "cat", "at ")
+    """
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(first: Set[str], second: Set[str], shared: int) -> float:
+    """
+    Jaccard similarity of two trigram sets given their overlap size
+    """
+    return shared / (len(first) + len(second) - shared)
+
+
+class TrigramService:
+    """
+    Service for fuzzy matching search terms against the decision vocabulary.
+
+    Every distinct word stored in a decision is broken into trigrams in the
+    search_term_trigrams side table. A misspelled query word is resolved
+    to the vocabulary terms sharing enough trigrams with it, which are then
+    searched through the regular FTS index.
+    """
+
+    @staticmethod
+    async def index_terms(db: aiosqlite.Connection, text: str):
+        """
+        Add the words of a decision to the trigram index
+
+        Runs on the caller's connection so it commits with the decision write.
+        """
+        rows = {
+            (trigram, word)
+            for word in set(extract_words(text))
+            if len(word) >= MIN_FUZZY_WORD_LENGTH
+            for trigram in trigrams(word)
+        }
+        if rows:
+            await db.executemany(
+                "INSERT OR IGNORE INTO search_term_trigrams (trigram, term) VALUES (?, ?)",
+                list(rows)
+            )
+
+    @staticmethod
+    async def find_similar_terms(word: str, threshold: float) -> List[str]:
+        """
+        Vocabulary terms whose trigram similarity to the word meets the threshold
+        """
+        word_trigrams = trigrams(word)
+        placeholders = ", ".join("?" for _ in word_trigrams)
+        query = f"""
+        SELECT term, COUNT(*) AS shared FROM search_term_trigrams
+        WHERE trigram IN ({placeholders})
+        GROUP BY term
+        """
+        results = await execute_query(query, tuple(word_trigrams))
+
+        scored = [
+            (trigram_similarity(word_trigrams, trigrams(row['term']), row['shared']), row['term'])
+            for row in results
+        ]
+        scored = sorted((item for item in scored if item[0] >= threshold), reverse=True)
+
+        return [term for _, term in scored[:MAX_FUZZY_ALTERNATIVES]]
+
+    @staticmethod
+    async def build_fuzzy_query(query: str, threshold: float) -> str:
+        """
+        Build an FTS5 MATCH expression that also accepts close spellings
+
+        Each query word becomes an OR group of itself and its closest
+        vocabulary terms; groups are ANDed together.
+
+        Example:
+            "postgress deploy" → '("postgress" OR "postgres") AND ("deploy" OR "deploys")'
+        """
+        groups = []
+
+        for word in extract_words(query):
+            alternatives = [word]
+            if len(word) >= MIN_FUZZY_WORD_LENGTH:
+                for term in await TrigramService.find_similar_terms(word, threshold):
+                    if term not in alternatives:
+                        alternatives.append(term)
+            groups.append("(" + " OR ".join(f'"{term}"' for term in alternatives) + ")")
+
+        return " AND ".join(groups)
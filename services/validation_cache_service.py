@@ -0,0 +1,185 @@
+"""
+Two-tier cache of LLM decision validation results
+"""
+import asyncio
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+from app.config import get_settings
+from app.database import execute_query, submit_write
+from app.models import ValidationResult
+
+settings = get_settings()
+
+# Typographic quotes and apostrophes, folded to their ASCII forms
+QUOTE_TRANSLATION = str.maketrans({
+    "‘": "'", "’": "'", "‚": "'", "‛": "'", "′": "'", "`": "'", "´": "'",
+    "“": '"', "”": '"', "„": '"', "‟": '"', "″": '"', "«": '"', "»": '"'
+})
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Cache key for a decision text: case, whitespace and quote style folded
+
+    Example:
+        '  Use “PostgreSQL”\\n for the DB ' → 'use "postgresql" for the db'
+    """
+    text = unicodedata.normalize("NFKC", text).translate(QUOTE_TRANSLATION)
+    return WHITESPACE_PATTERN.sub(" ", text).strip().casefold()
+
+
+class ValidationCacheStats:
+    """
+    Lookup counters for the health endpoint
+    """
+
+    def __init__(self):
+        self.memory_hits = 0
+        self.database_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.memory_hits + self.database_hits + self.misses
+        hits = self.memory_hits + self.database_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "database_hits": self.database_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round(hits / lookups, 3) if lookups else None
+        }
+
+
+# In-memory tier: normalized text → (prompt_version, cached_at, result)
+_memory: "OrderedDict[str, Tuple[str, float, ValidationResult]]" = OrderedDict()
+_stats = ValidationCacheStats()
+# Table writes still in flight; kept so the tasks are not garbage collected
+_pending_stores: Set[asyncio.Task] = set()
+
+
+class ValidationCacheService:
+    """
+    LRU in front of the validation_cache table
+
+    Entries are keyed by normalized text and tagged with the prompt version
+    that produced them; an entry from another prompt version, or older than
+    VALIDATION_CACHE_TTL_HOURS, is treated as a miss. Only real LLM answers
+    are stored, never fallback results.
+    """
+
+    @staticmethod
+    def _ttl_seconds() -> float:
+        return settings.validation_cache_ttl_hours * 3600
+
+    @staticmethod
+    def _remember(key: str, prompt_version: str, cached_at: float, result: ValidationResult):
+        _memory[key] = (prompt_version, cached_at, result)
+        _memory.move_to_end(key)
+        while len(_memory) > settings.validation_cache_size:
+            _memory.popitem(last=False)
+
+    @staticmethod
+    async def get(text: str, prompt_version: str) -> Optional[ValidationResult]:
+        """
+        Look up a cached validation, memory first, then the table
+        """
+        key = normalize_text(text)
+        oldest = time.time() - ValidationCacheService._ttl_seconds()
+
+        entry = _memory.get(key)
+        if entry is not None:
+            entry_version, cached_at, result = entry
+            if entry_version == prompt_version and cached_at >= oldest:
+                _memory.move_to_end(key)
+                _stats.memory_hits += 1
+                return result
+            del _memory[key]
+
+        row = await execute_query(
+            """
+            SELECT is_valid, reason, cached_at FROM validation_cache
+            WHERE text_key = ? AND prompt_version = ? AND cached_at >= ?
+            """,
+            (key, prompt_version, int(oldest)),
+            fetch_one=True
+        )
+        if row is None:
+            _stats.misses += 1
+            return None
+
+        result = ValidationResult(is_valid=bool(row['is_valid']), reason=row['reason'])
+        ValidationCacheService._remember(key, prompt_version, row['cached_at'], result)
+        _stats.database_hits += 1
+        return result
+
+    @staticmethod
+    def put(text: str, prompt_version: str, result: ValidationResult):
+        """
+        Store an LLM validation result in both tiers
+
+        The table row is written in the background, so callers don't wait
+        for a group commit. No cached query reads validation_cache, so the
+        write leaves the result cache's write generation alone.
+        """
+        key = normalize_text(text)
+        cached_at = int(time.time())
+        ValidationCacheService._remember(key, prompt_version, cached_at, result)
+
+        query = """
+        INSERT INTO validation_cache (text_key, prompt_version, is_valid, reason, cached_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (text_key) DO UPDATE
+        SET prompt_version = excluded.prompt_version, is_valid = excluded.is_valid,
+            reason = excluded.reason, cached_at = excluded.cached_at
+        """
+
+        async def store(db):
+            await db.execute(query, (key, prompt_version, int(result.is_valid), result.reason, cached_at))
+
+        task = asyncio.create_task(submit_write(store, bump_generation=False))
+        _pending_stores.add(task)
+        task.add_done_callback(ValidationCacheService._store_done)
+
+    @staticmethod
+    def _store_done(task: asyncio.Task):
+        _pending_stores.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            print(f"⚠️ Could not store validation cache entry: {task.exception()}")
+            return
+        _stats.stores += 1
+
+    @staticmethod
+    async def prune(prompt_version: str) -> int:
+        """
+        Delete expired rows and rows from other prompt versions
+        """
+        oldest = int(time.time() - ValidationCacheService._ttl_seconds())
+
+        async def delete(db):
+            cursor = await db.execute(
+                "DELETE FROM validation_cache WHERE cached_at < ? OR prompt_version != ?",
+                (oldest, prompt_version)
+            )
+            return cursor.rowcount
+
+        return await submit_write(delete, bump_generation=False)
+
+    @staticmethod
+    def get_status() -> dict:
+        """
+        Describe the cache for the health endpoint
+        """
+        return {
+            "memory_entries": len(_memory),
+            "max_memory_entries": settings.validation_cache_size,
+            "ttl_hours": settings.validation_cache_ttl_hours,
+            **_stats.as_dict()
+        }
@@ -1,12 +1,16 @@
 """
 Voting/approval service for proposed decisions
 """
-from app.database import execute_query, execute_insert
-from app.models import ProposedDecision, Decision
+from app.database import execute_query, execute_insert, transaction
+from app.models import ProposedDecision
+from app.records import ProposalRecord
 from app.config import get_settings
-from typing import Optional
-from datetime import datetime, timedelta
-import json
+from utils import clock
+from services.decision_service import DecisionService
+from services.expiry_service import ExpiryService
+from services.similarity_service import embed_text
+from typing import List, Optional
+from datetime import timedelta
 
 settings = get_settings()
 
@@ -21,18 +25,19 @@ class VotingService:
         """
         Create a new decision proposal
         """
-        expires_at = datetime.now() + timedelta(minutes=settings.voting_timeout_minutes)
+        expires_at = clock.now() + timedelta(minutes=settings.voting_timeout_minutes)
         
         query = """
         INSERT INTO proposed_decisions 
-        (text, proposer, threshold, expires_at, approvals, rejections)
-        VALUES (?, ?, ?, ?, '[]', '[]')
+        (text, proposer, threshold, expires_at)
+        VALUES (?, ?, ?, ?)
         """
         
         proposal_id = await execute_insert(
             query, 
             (text, proposer, settings.voting_approval_threshold, expires_at.isoformat())
         )
+        ExpiryService.schedule(proposal_id, clock.to_epoch(expires_at))
         
         return ProposedDecision(
             id=proposal_id,
@@ -42,6 +47,38 @@ class VotingService:
             expires_at=expires_at
         )
     
+    @staticmethod
+    async def _attach_votes(proposals: List[ProposalRecord], db=None):
+        """
+        Fill in the approval and rejection lists from proposal_votes
+        
+        Runs on the given connection (e.g. inside a transaction) or a pooled
+        reader. Voters are listed in the order they voted.
+        """
+        if not proposals:
+            return
+        
+        by_id = {proposal.id: proposal for proposal in proposals}
+        placeholders = ", ".join("?" for _ in by_id)
+        query = f"""
+        SELECT proposal_id, user, vote FROM proposal_votes
+        WHERE proposal_id IN ({placeholders})
+        ORDER BY voted_at, user
+        """
+        
+        if db is None:
+            rows = await execute_query(query, tuple(by_id))
+        else:
+            cursor = await db.execute(query, tuple(by_id))
+            rows = await cursor.fetchall()
+        
+        for row in rows:
+            proposal = by_id[row['proposal_id']]
+            if row['vote'] == "approve":
+                proposal.approvals.append(row['user'])
+            else:
+                proposal.rejections.append(row['user'])
+    
     @staticmethod
     async def get_proposal_by_id(proposal_id: int) -> Optional[ProposedDecision]:
         """
@@ -53,23 +90,22 @@ class VotingService:
         if not result:
             return None
         
-        return ProposedDecision(
-            id=result['id'],
-            text=result['text'],
-            proposer=result['proposer'],
-            timestamp=datetime.fromisoformat(result['timestamp']),
-            approvals=json.loads(result['approvals']),
-            rejections=json.loads(result['rejections']),
-            status=result['status'],
-            threshold=result['threshold'],
-            expires_at=datetime.fromisoformat(result['expires_at']) if result['expires_at'] else None
-        )
+        proposal = ProposalRecord.from_row(result)
+        await VotingService._attach_votes([proposal])
+        return proposal.to_model()
     
     @staticmethod
     async def add_vote(proposal_id: int, user: str, vote_type: str) -> Optional[ProposedDecision]:
         """
         Add a vote (approve/reject) to a proposal
         
+        Each voter has one row in proposal_votes, so the vote is a single
+        UPSERT (changing sides overwrites it) and concurrent voters never
+        clobber each other. Tallies are indexed COUNTs, and the status
+        transition is decided in the same transaction. The vote that gets
+        a proposal approved also logs it as a decision, in that same
+        transaction, linked back through decisions.proposal_id.
+        
         Args:
             proposal_id: ID of the proposal
             user: Username voting
@@ -78,102 +114,94 @@ class VotingService:
         Returns:
             Updated ProposedDecision or None if proposal not found
         """
-        proposal = await VotingService.get_proposal_by_id(proposal_id)
+        promoted = None
         
-        if not proposal:
-            return None
-        
-        # Check if proposal is still pending
-        if proposal.status != "pending":
-            return proposal
-        
-        # Check if expired
-        if proposal.expires_at and datetime.now() > proposal.expires_at:
-            await VotingService._mark_expired(proposal_id)
-            proposal.status = "expired"
-            return proposal
-        
-        # Check if user is proposer and self-approval not allowed
-        if not settings.allow_self_approve and user == proposal.proposer:
-            return None  # Silent fail or could return error
-        
-        # Remove user from opposite list if present
-        if vote_type == "approve":
-            if user in proposal.rejections:
-                proposal.rejections.remove(user)
-            if user not in proposal.approvals:
-                proposal.approvals.append(user)
-        else:  # reject
-            if user in proposal.approvals:
-                proposal.approvals.remove(user)
-            if user not in proposal.rejections:
-                proposal.rejections.append(user)
-        
-        # Update database
-        update_query = """
-        UPDATE proposed_decisions 
-        SET approvals = ?, rejections = ?
-        WHERE id = ?
-        """
-        
-        await execute_query(
-            update_query,
-            (json.dumps(proposal.approvals), json.dumps(proposal.rejections), proposal_id)
-        )
+        async with transaction() as db:
+            cursor = await db.execute("SELECT * FROM proposed_decisions WHERE id = ?", (proposal_id,))
+            row = await cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            proposal = ProposalRecord.from_row(row)
+            
+            # Check if proposal is still pending
+            if proposal.status != "pending":
+                await VotingService._attach_votes([proposal], db)
+                return proposal.to_model()
+            
+            # Past its deadline: report it expired; ExpiryService persists the status
+            if VotingService._is_expired(proposal, clock.to_epoch(clock.now())):
+                proposal.status = "expired"
+                await VotingService._attach_votes([proposal], db)
+                return proposal.to_model()
+            
+            # Check if user is proposer and self-approval not allowed
+            if not settings.allow_self_approve and user == proposal.proposer:
+                return None  # Silent fail or could return error
+            
+            # Record the vote, replacing this user's earlier vote if any
+            vote_query = """
+            INSERT INTO proposal_votes (proposal_id, user, vote, voted_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (proposal_id, user) DO UPDATE
+            SET vote = excluded.vote, voted_at = excluded.voted_at
+            WHERE vote != excluded.vote
+            """
+            await db.execute(vote_query, (proposal_id, user, vote_type, clock.to_epoch(clock.now())))
+            
+            # Tally from the (proposal_id, vote) index
+            cursor = await db.execute(
+                "SELECT vote, COUNT(*) AS count FROM proposal_votes WHERE proposal_id = ? GROUP BY vote",
+                (proposal_id,)
+            )
+            tally = {tally_row['vote']: tally_row['count'] for tally_row in await cursor.fetchall()}
+            
+            # Check if threshold met
+            if tally.get("approve", 0) >= proposal.threshold:
+                new_status = "approved"
+            elif tally.get("reject", 0) >= proposal.threshold:
+                new_status = "rejected"
+            else:
+                new_status = None
+            
+            if new_status:
+                # Only a still-pending row transitions, and the unique
+                # proposal_id index admits one decision per proposal, so a
+                # proposal is never logged twice
+                cursor = await db.execute(
+                    "UPDATE proposed_decisions SET status = ? WHERE id = ? AND status = 'pending' RETURNING id",
+                    (new_status, proposal_id)
+                )
+                if await cursor.fetchone() is not None:
+                    proposal.status = new_status
+                    if new_status == "approved":
+                        vector = embed_text(proposal.text)
+                        promoted = await DecisionService.insert_decision(
+                            db, proposal.text, proposal.proposer, None, vector, proposal_id=proposal_id
+                        )
+            
+            await VotingService._attach_votes([proposal], db)
         
-        # Check if threshold met
-        if len(proposal.approvals) >= proposal.threshold:
-            await VotingService._mark_approved(proposal_id)
-            proposal.status = "approved"
-        elif len(proposal.rejections) >= proposal.threshold:
-            await VotingService._mark_rejected(proposal_id)
-            proposal.status = "rejected"
+        if promoted:
+            DecisionService.index_decision(promoted, vector)
         
-        return proposal
-    
-    @staticmethod
-    async def _mark_approved(proposal_id: int):
-        """
-        Mark proposal as approved
-        """
-        query = "UPDATE proposed_decisions SET status = 'approved' WHERE id = ?"
-        await execute_query(query, (proposal_id,))
-    
-    @staticmethod
-    async def _mark_rejected(proposal_id: int):
-        """
-        Mark proposal as rejected
-        """
-        query = "UPDATE proposed_decisions SET status = 'rejected' WHERE id = ?"
-        await execute_query(query, (proposal_id,))
-    
-    @staticmethod
-    async def _mark_expired(proposal_id: int):
-        """
-        Mark proposal as expired
-        """
-        query = "UPDATE proposed_decisions SET status = 'expired' WHERE id = ?"
-        await execute_query(query, (proposal_id,))
+        return proposal.to_model()
     
     @staticmethod
-    async def convert_proposal_to_decision(proposal: ProposedDecision) -> Decision:
+    def _is_expired(proposal: ProposalRecord, now: int) -> bool:
         """
-        Convert approved proposal to a decision
+        Whether a proposal's voting window has closed (now in epoch seconds)
         """
-        from services.decision_service import DecisionService
-        
-        decision = await DecisionService.add_decision(
-            text=proposal.text,
-            user=proposal.proposer,
-            topic=None
-        )
-        
-        return decision
+        return proposal.expires_at is not None and clock.to_epoch(proposal.expires_at) <= now
     
     @staticmethod
     async def get_pending_proposals() -> list[ProposedDecision]:
         """
         Get all pending proposals
+        
+        Read-only: proposals past their deadline are left out here and
+        marked expired in bulk by ExpiryService.
         """
         query = """
         SELECT * FROM proposed_decisions 
@@ -182,25 +210,12 @@ class VotingService:
         """
         results = await execute_query(query)
         
-        proposals = []
-        for row in results:
-            proposal = ProposedDecision(
-                id=row['id'],
-                text=row['text'],
-                proposer=row['proposer'],
-                timestamp=datetime.fromisoformat(row['timestamp']),
-                approvals=json.loads(row['approvals']),
-                rejections=json.loads(row['rejections']),
-                status=row['status'],
-                threshold=row['threshold'],
-                expires_at=datetime.fromisoformat(row['expires_at']) if row['expires_at'] else None
-            )
-            
-            # Check expiration
-            if proposal.expires_at and datetime.now() > proposal.expires_at:
-                await VotingService._mark_expired(proposal.id)
-            else:
-                proposals.append(proposal)
+        now = clock.to_epoch(clock.now())
+        proposals = [
+            proposal for proposal in map(ProposalRecord.from_row, results)
+            if not VotingService._is_expired(proposal, now)
+        ]
         
-        return proposals
+        await VotingService._attach_votes(proposals)
+        return [proposal.to_model() for proposal in proposals]
     
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Shared test setup: a scratch database and the offline LLM provider
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Settings are read once at import time, so point them at scratch locations first
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["DATABASE_PATH"] = str(Path(tempfile.mkdtemp()) / "test.db")
+os.environ["LLM_PROVIDER"] = "stub"
+
+import pytest_asyncio
+
+from app.database import close_pool, init_database, open_pool
+
+
+@pytest_asyncio.fixture
+async def database():
+    """
+    Open the connection pool on the scratch database for one test
+    """
+    await open_pool()
+    await init_database()
+    yield
+    await close_pool()
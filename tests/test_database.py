@@ -0,0 +1,48 @@
+"""
+Tests for the writer connection's transaction handling
+"""
+import sqlite3
+
+import pytest
+
+from app.database import execute_query, get_pool, submit_write, transaction
+
+INSERT_DECISION = "INSERT INTO decisions (text, user, created_at, day_key) VALUES (?, 'tester', 0, 19700101)"
+
+
+def fail_next_commit(db):
+    """
+    Make the connection's next COMMIT raise, as SQLITE_BUSY or a disk error would
+    """
+    execute = db.execute
+
+    async def failing_execute(sql, *args, **kwargs):
+        if sql == "COMMIT":
+            del db.execute
+            raise sqlite3.OperationalError("disk I/O error")
+        return await execute(sql, *args, **kwargs)
+
+    db.execute = failing_execute
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_rolls_back_and_frees_the_writer(database):
+    with pytest.raises(sqlite3.OperationalError):
+        async with transaction() as db:
+            await db.execute(INSERT_DECISION, ("lost in the failed commit",))
+            fail_next_commit(db)
+
+    pool = await get_pool()
+    async with pool.writer() as db:
+        assert not db.in_transaction
+
+    async with transaction() as db:
+        await db.execute(INSERT_DECISION, ("written by transaction()",))
+
+    async def insert(db):
+        await db.execute(INSERT_DECISION, ("written through the write queue",))
+
+    await submit_write(insert)
+
+    rows = await execute_query("SELECT text FROM decisions ORDER BY id")
+    assert [row['text'] for row in rows] == ["written by transaction()", "written through the write queue"]
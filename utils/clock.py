@@ -0,0 +1,75 @@
+"""
+Epoch timestamps and team-timezone day buckets
+"""
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+@lru_cache()
+def team_timezone() -> ZoneInfo:
+    """
+    The team's timezone (SUMMARY_TIMEZONE), which defines what "today" is
+    """
+    return ZoneInfo(settings.summary_timezone)
+
+
+def now() -> datetime:
+    """
+    Current time in the team's timezone
+    """
+    return datetime.now(team_timezone())
+
+
+def to_epoch(moment: datetime) -> int:
+    """
+    Convert a datetime to Unix epoch seconds
+
+    Naive datetimes are taken to be in the team's timezone.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=team_timezone())
+    return int(moment.timestamp())
+
+
+def from_epoch(seconds: Optional[int]) -> Optional[datetime]:
+    """
+    Convert stored epoch seconds to a datetime in the team's timezone
+    """
+    if seconds is None:
+        return None
+    return datetime.fromtimestamp(seconds, team_timezone())
+
+
+def from_utc(moment: datetime) -> datetime:
+    """
+    Convert a naive UTC datetime, as written by SQLite's CURRENT_TIMESTAMP,
+    to the team's timezone
+    """
+    return moment.replace(tzinfo=timezone.utc).astimezone(team_timezone())
+
+
+def day_key(moment: datetime) -> int:
+    """
+    Calendar day of a moment in the team's timezone, as YYYYMMDD
+
+    Example:
+        2025-03-31 23:30 UTC in Africa/Lagos → 20250401
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(team_timezone())
+    return moment.year * 10000 + moment.month * 100 + moment.day
+
+
+def day_bounds(day: date) -> Tuple[int, int]:
+    """
+    Epoch seconds of the start of a team-timezone day and of the next day
+    """
+    start = datetime(day.year, day.month, day.day, tzinfo=team_timezone())
+    end = start + timedelta(days=1)
+    return int(start.timestamp()), int(end.timestamp())
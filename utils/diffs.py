@@ -0,0 +1,80 @@
+"""
+Compact text deltas for decision edit history
+"""
+import json
+import re
+from difflib import SequenceMatcher
+from typing import List, Tuple
+
+# Words, runs of whitespace and single punctuation marks
+TOKEN_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+def _tokens(text: str) -> Tuple[List[str], List[int]]:
+    """
+    Tokenize text and return the tokens with their character offsets
+    """
+    tokens = TOKEN_PATTERN.findall(text)
+    offsets = [0]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+    return tokens, offsets
+
+
+def make_delta(text: str, base: str) -> str:
+    """
+    Encode `text` as a delta against `base`
+
+    The delta is a JSON list of [start, end] character ranges copied from
+    the base and literal strings in between:
+        make_delta("Use MySQL for the database", "Use PostgreSQL for the database")
+        → '[[0,4],"MySQL",[14,31]]'
+    """
+    text_tokens, text_offsets = _tokens(text)
+    base_tokens, base_offsets = _tokens(base)
+
+    ops = []
+    matcher = SequenceMatcher(None, base_tokens, text_tokens, autojunk=False)
+    for tag, base_start, base_end, text_start, text_end in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([base_offsets[base_start], base_offsets[base_end]])
+        elif tag in ("replace", "insert"):
+            ops.append(text[text_offsets[text_start]:text_offsets[text_end]])
+
+    return json.dumps(ops, separators=(",", ":"), ensure_ascii=False)
+
+
+def apply_delta(base: str, delta: str) -> str:
+    """
+    Rebuild the text a delta was made from, given the same base
+    """
+    return "".join(
+        base[op[0]:op[1]] if isinstance(op, list) else op
+        for op in json.loads(delta)
+    )
+
+
+def render_delta(base: str, delta: str) -> str:
+    """
+    Show the edit from the delta's text to its base inline
+
+    Removed text is wrapped in [- -] and added text in {+ +}:
+        "Use [-MySQL-]{+PostgreSQL+} for the database"
+    """
+    parts = []
+    position = 0
+
+    for op in json.loads(delta):
+        if isinstance(op, list):
+            start, end = op
+            if start > position:
+                parts.append(f"{{+{base[position:start]}+}}")
+            parts.append(base[start:end])
+            position = end
+        else:
+            parts.append(f"[-{op}-]")
+
+    if position < len(base):
+        parts.append(f"{{+{base[position:]}+}}")
+
+    return "".join(parts)
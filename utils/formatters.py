@@ -1,8 +1,9 @@
 """
 Response formatting utilities
 """
-from app.models import Decision, ProposedDecision
-from typing import List
+from app.models import Decision, DecisionHistory, ProposedDecision, SearchFilters
+from app.records import DecisionRecord
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
@@ -22,7 +23,18 @@ class ResponseFormatter:
         )
     
     @staticmethod
-    def format_decision_list(decisions: List[Decision]) -> str:
+    def format_duplicate_warning(duplicates: List[Tuple[Decision, float]]) -> str:
+        """
+        Format a warning linking to existing near-duplicate decisions
+        """
+        items = [
+            f"• #{d.id} \"{d.text}\" (by {d.user}, {score:.0%} match)"
+            for d, score in duplicates
+        ]
+        return "\n\n⚠️ Possible duplicate of:\n" + "\n".join(items)
+    
+    @staticmethod
+    def format_decision_list(decisions: List[DecisionRecord]) -> str:
         """
         Format list of decisions
         """
@@ -51,14 +63,22 @@ class ResponseFormatter:
         )
     
     @staticmethod
-    def format_search_results(decisions: List[Decision], query: str) -> str:
+    def format_search_results(
+        decisions: List[DecisionRecord],
+        query: str,
+        fuzzy: bool = False,
+        filters: Optional[SearchFilters] = None
+    ) -> str:
         """
         Format search results
         """
+        criteria = ResponseFormatter.format_search_criteria(query, filters)
         if not decisions:
-            return f"🔍 No decisions found matching \"{query}\""
+            return f"🔍 No decisions found matching {criteria}"
         
-        header = f"🔍 Found {len(decisions)} decision(s) matching \"{query}\":\n\n"
+        header = f"🔍 Found {len(decisions)} decision(s) matching {criteria}:\n\n"
+        if fuzzy:
+            header = f"🔍 Found {len(decisions)} decision(s) closely matching {criteria}:\n\n"
         
         items = []
         for i, d in enumerate(decisions, 1):
@@ -67,6 +87,91 @@ class ResponseFormatter:
         
         return header + "\n".join(items)
     
+    @staticmethod
+    def format_search_criteria(query: str, filters: Optional[SearchFilters] = None) -> str:
+        """
+        Describe a search query and its active filters
+        
+        Examples:
+            ("deploy", SearchFilters(user="alice")) → '"deploy" (user: alice)'
+            ("", SearchFilters(since=date(2025, 1, 1))) → 'since 2025-01-01'
+        """
+        parts = []
+        if filters is not None:
+            if filters.user:
+                parts.append(f"user: {filters.user}")
+            if filters.topic:
+                parts.append(f"topic: {filters.topic}")
+            if filters.since:
+                parts.append(f"since {filters.since.isoformat()}")
+            if filters.until:
+                parts.append(f"until {filters.until.isoformat()}")
+        
+        summary = ", ".join(parts)
+        if not query:
+            return summary
+        return f"\"{query}\" ({summary})" if summary else f"\"{query}\""
+    
+    @staticmethod
+    def format_search_facets(facets: Dict[str, Dict[str, int]]) -> str:
+        """
+        Format per-user and per-topic match counts under search results
+        """
+        lines = []
+        for label, key in (("Users", "user"), ("Topics", "topic")):
+            counts = facets.get(key)
+            if counts:
+                lines.append(f"{label}: " + ", ".join(f"{value} ({count})" for value, count in counts.items()))
+        
+        if not lines:
+            return ""
+        
+        return "\n\n📊 " + "\n📊 ".join(lines)
+    
+    @staticmethod
+    def format_similar_results(matches: List[Tuple[Decision, float]], text: str) -> str:
+        """
+        Format similar-decision results with their similarity scores
+        """
+        if not matches:
+            return f"🧭 No decisions similar to \"{text}\""
+        
+        header = f"🧭 Decisions similar to \"{text}\":\n\n"
+        
+        items = []
+        for i, (d, score) in enumerate(matches, 1):
+            date_str = d.timestamp.strftime("%b %d")
+            items.append(f"{i}. [{date_str}] #{d.id} {d.text} ({score:.0%} similar)\n   by {d.user}")
+        
+        return header + "\n".join(items)
+    
+    @staticmethod
+    def format_decision_history(history: List[DecisionHistory], decision_id: int, diff: bool = False) -> str:
+        """
+        Format the edit history of a decision (as inline diffs with diff=True)
+        """
+        if not history:
+            return f"📜 Decision #{decision_id} has no edit history"
+        
+        header = f"📜 History for decision #{decision_id}:\n\n"
+        
+        items = []
+        for h in history:
+            date_str = h.edited_at.strftime("%b %d, %Y at %I:%M %p")
+            if diff:
+                items.append(f"• {h.diff}\n   edited by {h.edited_by} on {date_str}")
+            else:
+                items.append(f"• \"{h.text}\"\n   replaced by {h.edited_by} on {date_str}")
+        
+        return header + "\n".join(items)
+    
+    @staticmethod
+    def format_next_page(command: str) -> str:
+        """
+        Format the hint pointing at the next page of results
+        """
+        return f"\n\n➡️ More results: `{command}`"
+    
     @staticmethod
     def format_proposal_created(proposal: ProposedDecision) -> str:
         """
@@ -119,6 +224,23 @@ class ResponseFormatter:
             f"This decision was not logged to the registry."
         )
     
+    @staticmethod
+    def format_proposals_expired(proposals: List[ProposedDecision]) -> str:
+        """
+        Format notice for proposals whose voting window closed
+        """
+        lines = [f"⏰ {len(proposals)} proposal(s) expired without enough votes:\n"]
+        for proposal in proposals:
+            lines.append(f"• #{proposal.id} \"{proposal.text}\" (proposed by {proposal.proposer})")
+        return "\n".join(lines)
+    
+    @staticmethod
+    def format_invalid_decision(reason: str) -> str:
+        """
+        Format message when text fails decision validation
+        """
+        return f"⚠️ That doesn't look like a decision: {reason}\nTry a clear statement, e.g. \"Use PostgreSQL for the user database\"."
+    
     @staticmethod
     def format_error(message: str) -> str:
         """
@@ -135,11 +257,13 @@ class ResponseFormatter:
 📖 **DecisionNote Commands**
 
 **Direct Commands:**
-• `/decision add "Your decision"` - Log a decision immediately
-• `/decision list` - View all recorded decisions
-• `/decision search "keyword"` - Search decisions by keyword
+• `/decision add "Your decision"` - Log a decision immediately (optional `--topic name`)
+• `/decision list` - View recorded decisions (`--after <cursor>` for the next page)
+• `/decision search "keyword"` - Search decisions by keyword (`"exact phrase"`, `prefix*`)
+  Filters: `--user name` `--topic name` `--since YYYY-MM-DD` `--until YYYY-MM-DD`
+• `/decision similar "text"` - Find decisions with similar meaning
 • `/decision edit <id> "New text"` - Update an existing decision
-• `/decision history <id>` - View edit history of a decision
+• `/decision history <id>` - View edit history of a decision (`--diff` shows what each edit changed)
 • `/decision help` - Show this help message
 
 **Voting/Approval:**
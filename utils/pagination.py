@@ -0,0 +1,48 @@
+"""
+Keyset (cursor) pagination utilities
+"""
+import base64
+import binascii
+import json
+from typing import Any, List
+
+
+class PageCursor:
+    """
+    Encode and decode opaque page cursors
+
+    A cursor carries the sort key of the last row on a page, e.g.
+    (timestamp, id) for the decision list. The next page starts strictly
+    after that key, so every page costs the same index range scan no
+    matter how deep the user pages.
+    """
+
+    @staticmethod
+    def encode(*key: Any) -> str:
+        """
+        Encode a sort key into a URL-safe token
+
+        Example:
+            PageCursor.encode("2025-01-01 10:00:00", 42) → "WyIyMDI1LTAx..."
+        """
+        raw = json.dumps(list(key), separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str, size: int) -> List[Any]:
+        """
+        Decode a token back into a sort key of the expected size
+
+        Raises:
+            ValueError: If the cursor is malformed or has the wrong shape
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid page cursor: {cursor}") from e
+
+        if not isinstance(key, list) or len(key) != size:
+            raise ValueError(f"Invalid page cursor: {cursor}")
+
+        return key
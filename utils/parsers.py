@@ -2,8 +2,23 @@
 Command parsing utilities
 """
 import re
+from datetime import date
 from typing import Optional, Tuple
 
+from app.models import SearchFilters
+
+# A quoted phrase or a single whitespace-delimited word
+SEARCH_TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+# Page cursor option accepted by list, search and history
+PAGE_CURSOR_PATTERN = re.compile(r'\s--after\s+(\S+)')
+
+# Topic option accepted by add
+TOPIC_PATTERN = re.compile(r'\s--topic\s+(?:"([^"]*)"|(\S+))')
+
+# Facet filter options accepted by search; values may be quoted
+SEARCH_FILTER_PATTERN = re.compile(r'(?:^|\s)--(user|topic|since|until)\s+(?:"([^"]*)"|(\S+))')
+
 
 class CommandParser:
     """
@@ -102,10 +117,125 @@ class CommandParser:
     def parse_search_query(message: str) -> str:
         """
         Extract search query from search command
+        
+        Phrases and prefixes are kept as typed so they can be passed to
+        `to_fts_query`:
+            '/decision search "use postgres"' → '"use postgres"'
+            "/decision search deploy*" → "deploy*"
         """
         _, query = CommandParser.parse_command(message)
         return query.strip() if query else ""
     
+    @staticmethod
+    def to_fts_query(query: str) -> str:
+        """
+        Convert a user search query into an FTS5 MATCH expression
+        
+        Every term is quoted so FTS5 operators and punctuation typed by users
+        are treated as plain text. Terms are ANDed together.
+        
+        Examples:
+            'postgres' → '"postgres"'
+            '"use postgres"' → '"use postgres"'  (phrase)
+            'deploy*' → '"deploy"*'  (prefix)
+            'api-gateway aws' → '"api-gateway" "aws"'
+        """
+        terms = []
+        
+        for phrase, word in SEARCH_TERM_PATTERN.findall(query):
+            if phrase:
+                text, prefix = phrase, ""
+            else:
+                prefix = "*" if word.endswith("*") else ""
+                text = word.rstrip("*")
+            
+            text = text.replace('"', "").strip()
+            if text:
+                terms.append(f'"{text}"{prefix}')
+        
+        return " ".join(terms)
+    
+    @staticmethod
+    def extract_page_cursor(message: str) -> Tuple[str, Optional[str]]:
+        """
+        Split the `--after <cursor>` option off a command
+        
+        Returns:
+            (message without the option, cursor or None)
+            
+        Examples:
+            "/decision list --after abc" → ("/decision list", "abc")
+            "/decision search deploy --after abc" → ("/decision search deploy", "abc")
+        """
+        match = PAGE_CURSOR_PATTERN.search(message)
+        
+        if not match:
+            return (message, None)
+        
+        remaining = message[:match.start()] + message[match.end():]
+        return (remaining.strip(), match.group(1))
+    
+    @staticmethod
+    def extract_flag(message: str, flag: str) -> Tuple[str, bool]:
+        """
+        Split a boolean `--flag` option off a command
+        
+        Examples:
+            ("/decision history 5 --diff", "diff") → ("/decision history 5", True)
+        """
+        words = message.split()
+        option = f"--{flag}"
+        
+        if option not in words:
+            return (message, False)
+        
+        return (" ".join(word for word in words if word != option), True)
+    
+    @staticmethod
+    def extract_topic(message: str) -> Tuple[str, Optional[str]]:
+        """
+        Split the `--topic <name>` option off an add command
+        
+        Examples:
+            '/decision add "Use Terraform" --topic infra' → ('/decision add "Use Terraform"', "infra")
+        """
+        match = TOPIC_PATTERN.search(message)
+        
+        if not match:
+            return (message, None)
+        
+        remaining = message[:match.start()] + message[match.end():]
+        return (remaining.strip(), match.group(1) or match.group(2))
+    
+    @staticmethod
+    def extract_search_filters(query: str) -> Tuple[str, SearchFilters]:
+        """
+        Split the facet filter options off a search query
+        
+        Returns:
+            (query without the options, filters)
+            
+        Examples:
+            "deploy --user alice --since 2025-01-01" → ("deploy", SearchFilters(user="alice", since=date(2025, 1, 1)))
+            '--topic "data platform"' → ("", SearchFilters(topic="data platform"))
+        
+        Raises:
+            ValueError: If --since or --until is not a YYYY-MM-DD date
+        """
+        values = {}
+        
+        for name, quoted, word in SEARCH_FILTER_PATTERN.findall(query):
+            value = quoted if quoted else word
+            if name in ("since", "until"):
+                try:
+                    value = date.fromisoformat(value)
+                except ValueError as e:
+                    raise ValueError(f"Invalid --{name} date: {value}") from e
+            values[name] = value
+        
+        remaining = SEARCH_FILTER_PATTERN.sub(" ", query)
+        return (" ".join(remaining.split()), SearchFilters(**values))
+    
     @staticmethod
     def parse_vote_command(message: str) -> Tuple[Optional[int], Optional[str]]:
         """
@@ -0,0 +1,71 @@
+"""
+Local heuristics for decision text
+"""
+import re
+from typing import Tuple
+
+# Words that mark a statement as a decision
+DECISION_KEYWORDS = [
+    "use", "adopt", "switch", "choose", "decide", "implement",
+    "deploy", "move", "change", "upgrade", "select", "go with",
+    "will", "should", "agreed", "approve"
+]
+
+# Whole-word match, so "use" doesn't fire on "because" or "house"
+KEYWORD_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(keyword) for keyword in DECISION_KEYWORDS) + r")\b",
+    re.IGNORECASE
+)
+VOWEL_PATTERN = re.compile(r"[aeiouy]", re.IGNORECASE)
+
+
+def alpha_ratio(text: str) -> float:
+    """
+    Share of characters that are letters or whitespace
+    """
+    letters = sum(c.isalpha() or c.isspace() for c in text)
+    return letters / max(len(text), 1)
+
+
+def score_decision_text(text: str) -> Tuple[float, str]:
+    """
+    Confidence from 0 to 1 that text is a meaningful decision, with the reason
+
+    Cheap enough to run on every message. Scores near 0 are clearly not
+    decisions (too short, mostly symbols, keyboard mashing), scores near 1
+    are well-formed statements with a decision keyword, and plain
+    statements without a keyword land in the middle.
+
+    Examples:
+        "ok" → 0.05
+        "asdfkjh qwrtp zxcvb" → 0.15
+        "Q3 roadmap review notes" → 0.65
+        "We will use PostgreSQL for the database" → 1.0
+    """
+    text = text.strip()
+    words = text.split()
+
+    if len(words) < 3:
+        return 0.05, "Decision is too short (minimum 3 words required)"
+
+    ratio = alpha_ratio(text)
+    if ratio < 0.6:
+        return 0.1, "Text contains too many non-alphabetic characters"
+
+    alphabetic = [word for word in words if word.isalpha()]
+    if alphabetic:
+        without_vowels = sum(not VOWEL_PATTERN.search(word) for word in alphabetic)
+        if without_vowels / len(alphabetic) > 0.5:
+            return 0.15, "Text looks like random characters"
+
+    score = 0.5
+    reason = "Passes basic validation checks"
+    if KEYWORD_PATTERN.search(text):
+        score += 0.35
+        reason = "Contains decision-related keywords"
+    if 4 <= len(words) <= 60:
+        score += 0.1
+    if ratio >= 0.8:
+        score += 0.05
+
+    return round(min(score, 1.0), 2), reason